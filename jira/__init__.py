@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 """The root of JIRA package namespace."""
 try:
-    import pkg_resources
+    try:
+        # importlib.metadata is much cheaper to import than pkg_resources
+        from importlib.metadata import version
+    except ImportError:  # Python < 3.8
+        from pkg_resources import get_distribution
 
-    __version__ = pkg_resources.get_distribution("jira").version
+        def version(distribution_name):
+            return get_distribution(distribution_name).version
+
+    __version__ = version("jira")
 except Exception:
     __version__ = "unknown"
 
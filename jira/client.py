@@ -8,30 +8,35 @@ responses from Jira and the Resource/dict abstractions provided by this library.
 will construct a JIRA object as described below. Full API documentation can be found
 at: https://jira.readthedocs.io/en/latest/
 """
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from functools import partial
 from functools import wraps
 
-import imghdr
-import mimetypes
-
 from collections.abc import Iterable
-import copy
+import defusedxml.ElementTree as defused_etree
 import json
 import logging
 import os
 import re
+import string
 
 
-import calendar
-import datetime
 import hashlib
+import itertools
 from numbers import Number
 import requests
 import sys
+import threading
 import time
+import types
 import warnings
+import weakref
 
+from requests.adapters import DEFAULT_POOLSIZE
+from requests.adapters import HTTPAdapter
 from requests.utils import get_netrc_auth
+from requests.utils import select_proxy
 from urllib.parse import urlparse
 
 # GreenHopper specific resources
@@ -63,6 +68,7 @@ from jira.resources import Role
 from jira.resources import SecurityLevel
 from jira.resources import ServiceDesk
 from jira.resources import Sprint
+from jira.resources import SprintReport
 from jira.resources import Status
 from jira.resources import StatusCategory
 from jira.resources import User
@@ -74,25 +80,68 @@ from jira.resources import Worklog
 
 from jira import __version__
 from jira.utils import CaseInsensitiveDict
+from jira.utils import json_dumps
 from jira.utils import json_loads
-from jira.utils import threaded_requests
-from pkg_resources import parse_version
+from jira.utils import json_loads_bytes
 
 from collections import OrderedDict
 
-try:
-    # noinspection PyUnresolvedReferences
-    from requests_toolbelt import MultipartEncoder
-except ImportError:
-    pass
+logging.getLogger("jira").addHandler(logging.NullHandler())
 
-try:
-    from requests_jwt import JWTAuth
-except ImportError:
-    pass
+# marker of the error page Jira returns with a 200 when the XSRF check failed
+_SECURITY_TOKEN_MISSING = b"<!-- SecurityTokenMissing -->"
 
+# the Service Desk API is still flagged experimental on older servers
+_SERVICE_DESK_HEADERS = {"X-ExperimentalApi": "opt-in"}
 
-logging.getLogger("jira").addHandler(logging.NullHandler())
+# seconds during which the transition names of an issue are reused
+_TRANSITIONS_TTL = 30
+# number of issues whose transition names are kept
+_TRANSITIONS_SIZE = 256
+
+# number of users whose accountId is remembered
+_ACCOUNT_IDS_SIZE = 1024
+
+# number of responses kept to be revalidated with their ETag
+_ETAG_CACHE_SIZE = 128
+_MIME_TYPES_SIZE = 128
+# number of first bytes of an avatar image its cached content type is keyed on
+_MIME_KEY_SIZE = 512
+
+# the percentage in the 'alternativePercentage' of a backup progress
+_BACKUP_PERCENTAGE_RE = re.compile(r"\s([0-9]*)\s")
+
+# directory of the package, the frames of which warnings do not point at
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+# signatures of the usual avatar formats, checked before asking libmagic
+_IMAGE_PREFIXES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"RIFF", "image/webp"),
+    (b"<svg", "image/svg+xml"),
+)
+
+# messages of the re-index page, see reindex()
+_REINDEX_NEEDED = b"To perform the re-index now, please go to the"
+_REINDEX_RUNNING = b"All issues are being re-indexed"
+
+# base of the Jira Cloud admin endpoints, which are not in the version 2 API
+_API_3_BASE_URL = "{server}/rest/api/3/{path}"
+
+# bodies of the Cloud backup() requests, by whether attachments are included
+_BACKUP_PAYLOADS = {
+    attachments: json_dumps({"cbAttachments": attachments})
+    for attachments in (False, True)
+}
+
+# bodies of move_version() for the positions accepted by Jira
+_VERSION_POSITIONS = {
+    position: json_dumps({"position": position})
+    for position in ("First", "Last", "Earlier", "Later")
+}
 
 
 def translate_resource_args(func):
@@ -105,14 +154,10 @@ def translate_resource_args(func):
         :type kwargs: **Any
         :return: Any
         """
-        arg_list = []
-        for arg in args:
-            if isinstance(arg, (Issue, Project)):
-                arg_list.append(arg.key)
-            else:
-                arg_list.append(arg)
-        result = func(*arg_list, **kwargs)
-        return result
+        return func(
+            *[arg.key if isinstance(arg, (Issue, Project)) else arg for arg in args],
+            **kwargs
+        )
 
     return wrapper
 
@@ -128,6 +173,116 @@ def _field_worker(fields=None, **fieldargs):
     return {"fields": fieldargs}
 
 
+def _get_file_size(filename, fileobj):
+    """Return the size of an uploaded file.
+
+    It is read from the open file when there is one, instead of looking the path
+    up again.
+
+    :type filename: str
+    :type fileobj: Any
+    :rtype: int
+    """
+    try:
+        return os.fstat(fileobj.fileno()).st_size
+    except (AttributeError, OSError):
+        # bytes, or an in-memory stream
+        return os.path.getsize(filename)
+
+
+def _image_prefix_type(buff):
+    """Get the content type of an image from its signature, if it is a usual one.
+
+    :type buff: bytes
+    :rtype: Optional[str]
+    """
+    for prefix, mime_type in _IMAGE_PREFIXES:
+        if buff.startswith(prefix):
+            # RIFF is also the container of WAV and AVI files
+            if prefix != b"RIFF" or buff[8:12] == b"WEBP":
+                return mime_type
+    return None
+
+
+def _caller_stacklevel():
+    """Return the ``stacklevel`` pointing a warning at the first caller out of this package.
+
+    It is meant to be passed to ``warnings.warn()`` by the function calling this one.
+
+    :rtype: int
+    """
+    frame = sys._getframe(1)
+    level = 1
+    while frame is not None and os.path.abspath(frame.f_code.co_filename).startswith(
+        _PACKAGE_DIR
+    ):
+        frame = frame.f_back
+        level += 1
+    return level
+
+
+@lru_cache(maxsize=None)
+def _get_multipart_encoder():
+    """Return requests_toolbelt's MultipartEncoder, or None if it is not installed.
+
+    It is only needed to upload attachments, so it is imported on first use.
+
+    :rtype: Optional[type]
+    """
+    try:
+        # noinspection PyUnresolvedReferences
+        from requests_toolbelt import MultipartEncoder
+    except ImportError:
+        return None
+    return MultipartEncoder
+
+
+@lru_cache(maxsize=None)
+def _url_fields(base):
+    """Return the names of the options used by the url template ``base``.
+
+    None is returned when the template does not end with the path, so that the
+    urls made from it do not share a prefix.
+
+    :type base: str
+    :rtype: Optional[Tuple[str, ...]]
+    """
+    if not base.endswith("{path}"):
+        return None
+    return tuple(
+        name
+        for _, name, _, _ in string.Formatter().parse(base)
+        if name and name != "path"
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_ijson():
+    """Return the ijson module, or None if it is not installed.
+
+    :rtype: Optional[module]
+    """
+    try:
+        import ijson
+    except ImportError:
+        return None
+    return ijson
+
+
+@lru_cache(maxsize=8)
+def _server_cache(server, user):
+    """Return the dict holding the metadata cached for a server and user.
+
+    Shared by all the clients connecting to the same server as the same user when
+    the ``cache_fields`` option is set. Only the 8 most recent pairs are kept.
+
+    :type server: str
+    :type user: Optional[str]
+    :rtype: Dict[str, Any]
+    """
+    return {}
+
+
 class ResultList(list):
     def __init__(
         self, iterable=None, _startAt=0, _maxResults=0, _total=0, _isLast=None
@@ -139,7 +294,10 @@ class ResultList(list):
         :type _total: int
         :type isLast: Optional[bool]
         """
-        if iterable is not None:
+        # a generator is not materialized: items are pulled from it as the
+        # ResultList is iterated, see JIRA._iter_pages()
+        self._lazy = isinstance(iterable, types.GeneratorType)
+        if iterable is not None and not self._lazy:
             list.__init__(self, iterable)
         else:
             list.__init__(self)
@@ -152,38 +310,40 @@ class ResultList(list):
 
         self.iterable = iterable or []
         self.current = self.startAt
+        self._cursor = None
+
+    def __iter__(self):
+        if self._lazy:
+            return self
+        return list.__iter__(self)
 
     def __next__(self):
         """
         :return: int
         """
-        self.current += 1
-        if self.current > self.total:
-            raise StopIteration
-        else:
-            return self.iterable[self.current - 1]
+        if self._lazy:
+            return next(self.iterable)
+        if self._cursor is None:
+            self._cursor = itertools.islice(
+                list.__iter__(self), self.current, self.total
+            )
+        return next(self._cursor)
 
 
 class QshGenerator(object):
     def __init__(self, context_path):
         self.context_path = context_path
+        # length of the prefix to strip from request paths, "/" is kept
+        self._context_path_len = len(context_path) if len(context_path) > 1 else 0
 
     def __call__(self, req):
         parse_result = urlparse(req.url)
 
-        path = (
-            parse_result.path[len(self.context_path) :]
-            if len(self.context_path) > 1
-            else parse_result.path
-        )
+        path = parse_result.path[self._context_path_len :]
         # Per Atlassian docs, use %20 for whitespace when generating qsh for URL
         # https://developer.atlassian.com/cloud/jira/platform/understanding-jwt/#qsh
         query = "&".join(sorted(parse_result.query.split("&"))).replace("+", "%20")
-        qsh = "%(method)s&%(path)s&%(query)s" % {
-            "method": req.method.upper(),
-            "path": path,
-            "query": query,
-        }
+        qsh = "&".join((req.method.upper(), path, query))
 
         return hashlib.sha256(qsh.encode("utf-8")).hexdigest()
 
@@ -271,6 +431,25 @@ class JIRA(object):
         * client_cert -- a tuple of (cert,key) for the requests library for client side SSL
         * check_update -- Check whether using the newest python-jira library version.
         * cookies -- A dict of custom cookies that are sent in all requests to the server.
+        * async_backend -- How the pages of paginated results, and the extended GreenHopper sprints, are
+                fetched concurrently when ``async_`` is set:
+                ``threads`` (the default) uses a pool of ``async_workers`` threads, ``aiohttp`` sends all the
+                requests from a single thread with aiohttp. The latter only supports anonymous and basic
+                authentication and HTTP proxies, and requests are not retried.
+        * cache_fields -- Share the results of ``fields()`` and ``server_info()`` between the clients of
+                the same server and user, which saves two requests per new client. Defaults to ``False``.
+        * metadata_ttl -- Number of seconds during which the results of ``issue_types()``, ``priorities()``,
+                ``projects()``, ``request_types()``, ``resolutions()``, ``statuses()`` and
+                ``statuscategories()`` are reused by the client. ``resolution()``, ``status()`` and
+                ``statuscategory()`` then look the id up in those lists. Defaults to ``0``, which
+                fetches them on every call.
+        * sub_resource_ttl -- Number of seconds during which the comments, worklogs and remote links listed
+                for an issue are returned by ``comment()``, ``worklog()`` and ``remote_link()`` without
+                requesting them again. Adding one to the issue through the client drops those of its
+                kind. Defaults to ``0``, which always requests them.
+        * sprint_report_ttl -- Number of seconds during which the sprint report of a board and sprint is reused
+                by ``incompletedIssuesEstimateSum()``, ``removed_issues()`` and ``removedIssuesEstimateSum()``.
+                Defaults to ``0``, which requests it on every call.
 
     :param basic_auth: A tuple of username and password to use when establishing a session via HTTP BASIC
         authentication.
@@ -319,9 +498,15 @@ class JIRA(object):
         "verify": True,
         "resilient": True,
         "async": False,
-        "async_workers": 5,
+        # same default as ThreadPoolExecutor on the Python versions we support
+        "async_workers": min(32, (os.cpu_count() or 1) * 5),
+        "async_backend": "threads",
         "client_cert": None,
         "check_update": False,
+        "cache_fields": False,
+        "metadata_ttl": 0,
+        "sub_resource_ttl": 0,
+        "sprint_report_ttl": 0,
         # amount of seconds to wait for loading a resource after updating it
         # used to avoid server side caching issues, used to be 4 seconds.
         "delay_reload": 0,
@@ -354,7 +539,7 @@ class JIRA(object):
         validate=False,
         get_server_info=True,
         async_=False,
-        async_workers=5,
+        async_workers=None,
         logging=True,
         max_retries=3,
         proxies=None,
@@ -419,7 +604,8 @@ class JIRA(object):
         :param async_: To enable async requests for those actions where we implemented it, like issue update() or delete().
         :type async_: bool
         :param async_workers: Set the number of worker threads for async operations.
-        :type async_workers: int
+            (Default: ``min(32, os.cpu_count() * 5)``)
+        :type async_workers: Optional[int]
         :param timeout: Set a read/connect timeout for the underlying calls to Jira (default: None)
         :type timeout: Optional[Any]
         Obviously this means that you cannot rely on the return code when this is enabled.
@@ -450,21 +636,64 @@ class JIRA(object):
             options["server"] = server
         if async_:
             options["async"] = async_
-            options["async_workers"] = async_workers
+            if async_workers:
+                options["async_workers"] = async_workers
 
         self.logging = logging
 
-        self._options = copy.copy(JIRA.DEFAULT_OPTIONS)
-
-        self._options.update(options)
+        self._options = {**JIRA.DEFAULT_OPTIONS, **options}
+        # some methods add headers for their requests, those must not leak into
+        # JIRA.DEFAULT_OPTIONS and the other clients
+        self._options["headers"] = dict(self._options["headers"])
 
         self._rank = None
+        self._rank_looked_up = False
+        self._sprint_field_id = None
+        # whether GreenHopper takes the fields of a new sprint with its creation,
+        # None until the first sprint is created, see create_sprint()
+        self._greenhopper_create_sprint_oneshot = None
+        self._warned_old_agile_version = False
+        self._warned_short_pages = False
+        # url template -> (values of the options it uses, prefix of its urls), see
+        # _get_url()
+        self._url_prefixes = {}
+        self._executor = None
+        self._async_get = None
+        self._async_do_executor = None
+        self._async_do_size = None
+        # Cloud sessions authenticated with the auth cookie, see deactivate_user()
+        self._deactivate_session = None
+        # the response of "myself", see current_user()
+        self._myself = None
+        # ids of the projects and issue types used to create issues, and
+        # accountIds of the users issues are assigned to
+        self._ids_lock = threading.Lock()
+        self._project_ids = {}
+        self._issue_type_ids = {}
+        self._account_ids = OrderedDict()
+        # issue -> (time of the lookup, {casefolded transition name: id})
+        self._transitions_cache = OrderedDict()
+        # see _get_metadata()
+        self._metadata_cache = {}
+        # (kind, issue) -> (time of the listing, {id: resource}), see
+        # _keep_sub_resources()
+        self._sub_resources = {}
+        # (url, params) -> (ETag, response), see _get_json_revalidated()
+        self._etag_lock = threading.Lock()
+        self._etag_cache = OrderedDict()
+        # (size, first bytes) of an avatar image -> its content type, see
+        # _get_mime_type()
+        self._mime_types = OrderedDict()
 
         # Rip off trailing slash since all urls depend on that
         if self._options["server"].endswith("/"):
             self._options["server"] = self._options["server"][:-1]
 
-        context_path = urlparse(self._options["server"]).path
+        self._server_parsed = urlparse(self._options["server"])
+        self._rest_api_url = self._options["server"] + "/rest/api/latest"
+        self._applinks_url = self._options["server"] + "/rest/applinks/latest"
+        self._servicedesk_url = self._options["server"] + "/rest/servicedeskapi"
+        context_path = self._server_parsed.path
         if len(context_path) > 0:
             self._options["context_path"] = context_path
 
@@ -474,7 +703,6 @@ class JIRA(object):
             self._create_oauth_session(oauth, timeout)
         elif basic_auth:
             self._create_http_basic_session(*basic_auth, timeout=timeout)
-            self._session.headers.update(self._options["headers"])
         elif jwt:
             self._create_jwt_session(jwt, timeout)
         elif kerberos:
@@ -494,6 +722,7 @@ class JIRA(object):
             self._session.cookies.update(self._options["cookies"])
 
         self._session.max_retries = max_retries
+        self._mount_adapters()
 
         if proxies:
             self._session.proxies = proxies
@@ -526,11 +755,12 @@ class JIRA(object):
             self._check_update_()
             JIRA.checked_version = True
 
-        self._fields = {}
-        for f in self.fields():
-            if "clauseNames" in f:
-                for name in f["clauseNames"]:
-                    self._fields[name] = f["id"]
+        self._fields = {
+            name: f["id"]
+            for f in self.fields()
+            if "clauseNames" in f
+            for name in f["clauseNames"]
+        }
 
     def _create_cookie_auth(self, auth, timeout):
         self._session = ResilientSession(timeout=timeout)
@@ -540,6 +770,8 @@ class JIRA(object):
 
     def _check_update_(self):
         """Check if the current version of the library is outdated."""
+        from pkg_resources import parse_version
+
         try:
             data = requests.get(
                 "https://pypi.python.org/pypi/jira/json", timeout=2.001
@@ -572,24 +804,237 @@ class JIRA(object):
                 # https://docs.python.org/2/reference/datamodel.html#object.__del__
                 pass
             self._session = None
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+            self._executor = None
+            self._async_get = None
+        executor = getattr(self, "_async_do_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+            self._async_do_executor = None
+        session = getattr(self, "_deactivate_session", None)
+        if session is not None:
+            session.close()
+            self._deactivate_session = None
+
+    def _mount_adapters(self, workers=None):
+        """Mount HTTP adapters with connection pools large enough for the async workers.
+
+        The default pools keep 10 connections, which makes the worker threads of
+        the async operations wait for each other, or open and drop connections,
+        as soon as there are more than 10 of them. The adapters are only replaced
+        when the current pools are too small.
+
+        :param workers: Number of threads sending requests concurrently. (Default: ``async_workers``)
+        :type workers: Optional[int]
+        """
+        pool_size = max(
+            DEFAULT_POOLSIZE, (workers or self._options["async_workers"]) * 2
+        )
+        if pool_size <= getattr(self, "_pool_size", 0):
+            return
+        # retries are handled by ResilientSession, not at the connection level
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._pool_size = pool_size
+
+    def _get_server_cache(self, per_user=True):
+        """Return the cache shared with the other clients of this server.
+
+        Returns None when the ``cache_fields`` option is not set, or when the
+        user cannot be told apart from the authentication used.
+
+        :param per_user: Whether the cached data depends on the authenticated user.
+        :type per_user: bool
+        :rtype: Optional[Dict[str, Any]]
+        """
+        if not self._options["cache_fields"]:
+            return None
+        user = None
+        if per_user:
+            auth = self._session.auth
+            if isinstance(auth, tuple):
+                user = auth[0]
+            elif auth is not None:
+                return None
+        return _server_cache(self._options["server"], user)
+
+    def _get_metadata(self, key, fetch, ttl_option="metadata_ttl"):
+        """Return the metadata (issue types, projects...) cached for ``key``, or fetch it.
+
+        The result of ``fetch`` is reused for the number of seconds in the
+        ``ttl_option`` option, ``metadata_ttl`` by default. When that option is not
+        set, ``fetch`` is called every time.
+
+        :param key: what is cached, with the ids the metadata depends on
+        :type key: Hashable
+        :param fetch: gets the metadata from the server
+        :type fetch: Callable[[], Any]
+        :param ttl_option: the option holding the number of seconds to reuse the result for
+        :type ttl_option: str
+        :rtype: Any
+        """
+        ttl = self._options[ttl_option]
+        if not ttl:
+            return fetch()
+        cached = self._metadata_cache.get(key)
+        if cached is None or time.monotonic() - cached[0] >= ttl:
+            cached = (time.monotonic(), fetch())
+            self._metadata_cache[key] = cached
+        return cached[1]
+
+    def _find_metadata(self, resource_cls, id, key, list_all):
+        """Get a resource by id, from those listed by ``list_all`` when ``metadata_ttl`` is set.
+
+        :param resource_cls: the class of the resource
+        :type resource_cls: type
+        :param id: ID of the resource to get
+        :param key: the key of the listing in the metadata cache
+        :type key: str
+        :param list_all: lists all the resources of ``resource_cls``
+        :type list_all: Callable[[], List[Resource]]
+        :rtype: Resource
+        """
+        if self._options["metadata_ttl"]:
+            by_id = self._get_metadata(
+                key + "-by-id", lambda: {str(r.id): r for r in list_all()}
+            )
+            if str(id) in by_id:
+                return by_id[str(id)]
+        return self._find_for_resource(resource_cls, id)
+
+    def _keep_sub_resources(self, kind, issue, resources):
+        """Remember the resources listed for an issue, for ``sub_resource_ttl`` seconds.
+
+        :param kind: "comment", "worklog" or "remotelink"
+        :type kind: str
+        :type issue: str
+        :type resources: List[Resource]
+        """
+        if self._options["sub_resource_ttl"]:
+            self._sub_resources[(kind, str(issue))] = (
+                time.monotonic(),
+                {str(resource.id): resource for resource in resources},
+            )
+
+    def _get_sub_resource(self, kind, issue, id):
+        """Return a resource listed for an issue less than ``sub_resource_ttl`` seconds ago.
+
+        :type kind: str
+        :type issue: str
+        :type id: str
+        :rtype: Optional[Resource]
+        """
+        listed = self._sub_resources.get((kind, str(issue)))
+        if listed is None:
+            return None
+        if time.monotonic() - listed[0] >= self._options["sub_resource_ttl"]:
+            return None
+        return listed[1].get(str(id))
+
+    def _get_executor(self):
+        """Return the thread pool shared by the asynchronous operations of this client.
+
+        :rtype: ThreadPoolExecutor
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._options["async_workers"]
+            )
+        return self._executor
+
+    def _map(self, func, iterable):
+        """Return the list of the results of func applied to each item of iterable.
+
+        The calls run concurrently on the thread pool of the client when the
+        ``async`` option is set, and one after the other otherwise.
+
+        :type func: Callable[[Any], Any]
+        :type iterable: Iterable[Any]
+        :rtype: List[Any]
+        """
+        if self._options["async"]:
+            return list(self._get_executor().map(func, iterable))
+        return [func(item) for item in iterable]
+
+    @staticmethod
+    def _chunks(items, size):
+        """Split the list of issue keys ``items`` into lists of at most ``size`` keys.
+
+        A single key given as a string, an empty list or a false ``size`` yields
+        ``items`` unchanged as the only chunk, so that one request is still sent.
+
+        :type items: Union[str, List[str]]
+        :type size: Optional[int]
+        :rtype: List[Union[str, List[str]]]
+        """
+        if isinstance(items, str) or not items or not size:
+            return [items]
+        items = list(items)
+        return [items[i : i + size] for i in range(0, len(items), size)]
+
+    def _use_aiohttp(self):
+        """Whether concurrent GET requests are sent with aiohttp rather than threads.
+
+        :rtype: bool
+        """
+        return bool(self._options["async"]) and (
+            self._options["async_backend"] == "aiohttp"
+        )
+
+    def _get_async_get(self):
+        """Return a callable sending a GET request in the background.
+
+        The callable takes the same arguments as ``self._session.get`` and returns
+        a future. A ``FuturesSession`` wrapping our session is created once and
+        reused; without requests_futures the requests are submitted to the thread
+        pool directly.
+
+        :rtype: Callable[..., concurrent.futures.Future]
+        """
+        if self._async_get is None:
+            try:
+                from requests_futures.sessions import FuturesSession
+            except ImportError:
+                self._async_get = partial(
+                    self._get_executor().submit, self._session.get
+                )
+            else:
+                future_session = FuturesSession(
+                    executor=self._get_executor(), session=self._session
+                )
+                self._async_get = future_session.get
+        return self._async_get
 
     def _check_for_html_error(self, content):
+        """Raise a JIRAError if the content of a response is a SecurityTokenMissing page.
+
+        :param content: The raw content of the response (``response.content``).
+        :type content: bytes
+        :rtype: bool
+        """
         # Jira has the bad habit of returning errors in pages with 200 and
-        # embedding the error in a huge webpage.
-        if "<!-- SecurityTokenMissing -->" in content:
+        # embedding the error in a huge webpage. The marker is near the top
+        # of the page, so only its beginning is searched.
+        if _SECURITY_TOKEN_MISSING in content[:4096]:
             logging.warning("Got SecurityTokenMissing")
-            raise JIRAError("SecurityTokenMissing: %s" % content)
-            return False
+            raise JIRAError(
+                "SecurityTokenMissing: %s" % content.decode("utf-8", "replace")
+            )
         return True
 
     def _get_sprint_field_id(self):
-        sprint_field_name = "Sprint"
-        sprint_field_id = [
-            f["schema"]["customId"]
-            for f in self.fields()
-            if f["name"] == sprint_field_name
-        ][0]
-        return sprint_field_id
+        # the field does not change, it is looked up once per client
+        if self._sprint_field_id is None:
+            sprint_field_name = "Sprint"
+            self._sprint_field_id = [
+                f["schema"]["customId"]
+                for f in self.fields()
+                if f["name"] == sprint_field_name
+            ][0]
+        return self._sprint_field_id
 
     def _fetch_pages(
         self,
@@ -622,97 +1067,259 @@ class JIRA(object):
         :type base: str
         :rtype: ResultList
         """
-        async_class = None
-        if self._options["async"]:
-            try:
-                from requests_futures.sessions import FuturesSession
+        pages = self._iter_pages(
+            item_type, items_key, request_path, startAt, maxResults, params, base
+        )
+        return ResultList(
+            list(pages), pages.startAt, pages.maxResults, pages.total, pages.isLast
+        )
 
-                async_class = FuturesSession
-            except ImportError:
-                pass
-            async_workers = self._options["async_workers"]
-        page_params = params.copy() if params else {}
+    def _iter_pages(
+        self,
+        item_type,
+        items_key,
+        request_path,
+        startAt=0,
+        maxResults=50,
+        params=None,
+        base=JIRA_BASE_URL,
+    ):
+        """Fetch pages lazily.
+
+        Takes the same arguments as :py:meth:`_fetch_pages`, but only the first page is
+        requested upfront. The returned ResultList is bound to a generator: the other
+        pages are fetched while iterating over it, so it can only be iterated once.
+
+        :rtype: ResultList
+        """
+        async_get = None
+        if self._options["async"]:
+            async_get = self._get_async_get()
+        page_params = dict(params) if params else {}
         if startAt:
             page_params["startAt"] = startAt
         if maxResults:
             page_params["maxResults"] = maxResults
 
         resource = self._get_json(request_path, params=page_params, base=base)
-        next_items_page = self._get_items_from_page(item_type, items_key, resource)
-        items = next_items_page
+        items = self._get_items_from_page(item_type, items_key, resource)
+
+        if isinstance(resource, dict):
+            total = resource.get("total")
+            # 'isLast' is the optional key added to responses in Jira Agile 6.7.6. So far not used in basic Jira API.
+            is_last = resource.get("isLast", False)
+            start_at_from_response = resource.get("startAt", 0)
+            max_results_from_response = resource.get("maxResults", 1)
+        else:
+            # if is a list
+            total = 1
+            is_last = True
+            start_at_from_response = 0
+            max_results_from_response = 1
 
-        if True:  # isinstance(resource, dict):
+        if (
+            maxResults
+            and isinstance(resource, dict)
+            and "maxResults" in resource
+            and max_results_from_response < maxResults
+            and (total is None or start_at_from_response + len(items) < total)
+        ):
+            self._warn_short_pages(max_results_from_response, maxResults)
 
-            if isinstance(resource, dict):
-                total = resource.get("total")
-                # 'isLast' is the optional key added to responses in Jira Agile 6.7.6. So far not used in basic Jira API.
-                is_last = resource.get("isLast", False)
-                start_at_from_response = resource.get("startAt", 0)
-                max_results_from_response = resource.get("maxResults", 1)
-            else:
-                # if is a list
-                total = 1
-                is_last = True
-                start_at_from_response = 0
-                max_results_from_response = 1
+        def iter_items():
+            yield from items
 
             # If maxResults evaluates as False, get all items in batches
-            if not maxResults:
-                page_size = max_results_from_response or len(items)
-                page_start = (startAt or start_at_from_response or 0) + page_size
-                if (
-                    async_class is not None
-                    and not is_last
-                    and (total is not None and len(items) < total)
-                ):
-                    async_fetches = []
-                    future_session = async_class(
-                        session=self._session, max_workers=async_workers
-                    )
-                    for start_index in range(page_start, total, page_size):
-                        page_params = params.copy()
-                        page_params["startAt"] = start_index
-                        page_params["maxResults"] = page_size
-                        url = self._get_url(request_path)
-                        r = future_session.get(url, params=page_params)
-                        async_fetches.append(r)
-                    for future in async_fetches:
-                        response = future.result()
-                        resource = json_loads(response)
-                        if resource:
-                            next_items_page = self._get_items_from_page(
-                                item_type, items_key, resource
-                            )
-                            items.extend(next_items_page)
-                while (
-                    async_class is None
-                    and not is_last
-                    and (total is None or page_start < total)
-                    and len(next_items_page) == page_size
-                ):
-                    page_params["startAt"] = page_start
-                    page_params["maxResults"] = page_size
-                    resource = self._get_json(
-                        request_path, params=page_params, base=base
+            if maxResults:
+                return
+            page_size = max_results_from_response or len(items)
+            page_start = (startAt or start_at_from_response or 0) + page_size
+            # startAt and maxResults are set for each page
+            base_items = tuple(
+                (k, v)
+                for k, v in (params or {}).items()
+                if k not in ("startAt", "maxResults")
+            )
+            if (
+                async_get is not None
+                and not is_last
+                and (total is not None and len(items) < total)
+            ):
+                url = self._get_url(request_path, base)
+                pages_params = [
+                    base_items + (("startAt", start_index), ("maxResults", page_size))
+                    for start_index in range(page_start, total, page_size)
+                ]
+                if self._use_aiohttp():
+                    resources = self._get_pages_aiohttp(url, pages_params)
+                else:
+                    async_fetches = [
+                        async_get(url, params=page_params)
+                        for page_params in pages_params
+                    ]
+                    # the futures are consumed in submission order to keep the
+                    # items sorted as the server returned them
+                    resources = (
+                        json_loads(future.result()) for future in async_fetches
                     )
+                for resource in resources:
                     if resource:
-                        next_items_page = self._get_items_from_page(
+                        yield from self._get_items_from_page(
                             item_type, items_key, resource
                         )
-                        items.extend(next_items_page)
-                        page_start += page_size
-                    else:
+            else:
+
+                def get_page(start_index):
+                    return self._get_json(
+                        request_path,
+                        params=base_items
+                        + (("startAt", start_index), ("maxResults", page_size)),
+                        base=base,
+                    )
+
+                def has_next_page(page_length, last_page):
+                    return (
+                        not last_page
+                        and (total is None or page_start < total)
+                        and page_length == page_size
+                    )
+
+                # the next page is requested before the items of the current
+                # one are built, so that the two overlap
+                next_page = None
+                if has_next_page(len(items), is_last):
+                    next_page = self._get_executor().submit(get_page, page_start)
+                while next_page is not None:
+                    resource = next_page.result()
+                    if not resource:
                         # if resource is an empty dictionary we assume no-results
                         break
+                    page_start += page_size
+                    if isinstance(resource, dict):
+                        raws = resource.get(items_key, ()) if items_key else ()
+                        last_page = resource.get("isLast", False)
+                    else:
+                        raws = resource
+                        last_page = False
+                    next_page = None
+                    if has_next_page(len(raws), last_page):
+                        next_page = self._get_executor().submit(get_page, page_start)
+                    yield from self._get_items_from_page(item_type, items_key, resource)
+
+        return ResultList(
+            iter_items(),
+            start_at_from_response,
+            max_results_from_response,
+            total,
+            is_last,
+        )
+
+    def _get_pages_aiohttp(self, url, pages_params):
+        """Get several pages concurrently with aiohttp, from the calling thread.
+
+        Used by :py:meth:`_iter_pages` when the ``async_backend`` option is ``aiohttp``.
+
+        :param url: URL of the pages.
+        :type url: str
+        :param pages_params: The query parameters of each page.
+        :type pages_params: List[Tuple[Tuple[str, Any], ...]]
+        :return: The decoded JSON of each page, in the same order as ``pages_params``.
+        :rtype: List[Any]
+        """
+        return self._get_many_aiohttp(
+            [(url, page_params) for page_params in pages_params]
+        )
+
+    def _get_many_aiohttp(self, requests_):
+        """Send several GET requests concurrently with aiohttp, from the calling thread.
+
+        At most ``async_workers`` connections are opened at the same time.
 
-            return ResultList(
-                items, start_at_from_response, max_results_from_response, total, is_last
+        :param requests_: The URL and query parameters of each request.
+        :type requests_: List[Tuple[str, Tuple[Tuple[str, Any], ...]]]
+        :return: The decoded JSON of each response, in the same order as ``requests_``.
+        :rtype: List[Any]
+        """
+        import asyncio
+        import ssl
+
+        try:
+            import aiohttp
+        except ImportError:
+            raise JIRAError(
+                "The aiohttp async backend requires aiohttp, install jira[async]"
             )
-        else:
-            # it seams that search_users can return a list() containing a single user!
-            return ResultList(
-                [item_type(self._options, self._session, resource)], 0, 1, 1, True
+
+        auth = self._session.auth
+        if auth is not None and not isinstance(auth, tuple):
+            raise JIRAError(
+                "The aiohttp async backend only supports anonymous and basic authentication"
             )
+        # the proxies of the session, those of the environment are used by
+        # aiohttp itself when the session trusts it
+        proxies = [select_proxy(url, self._session.proxies) for url, _ in requests_]
+        if any(p and not p.startswith(("http://", "https://")) for p in proxies):
+            raise JIRAError("The aiohttp async backend only supports HTTP proxies")
+        verify = self._session.verify
+        ssl_context = None if verify is True else False
+        if isinstance(verify, str) or self._session.cert:
+            ssl_context = ssl.create_default_context(
+                cafile=verify if isinstance(verify, str) else None
+            )
+            if verify is False:
+                ssl_context.check_hostname = False
+                ssl_context.verify_mode = ssl.CERT_NONE
+            cert = self._session.cert
+            if cert:
+                if isinstance(cert, str):
+                    ssl_context.load_cert_chain(cert)
+                else:
+                    ssl_context.load_cert_chain(*cert)
+
+        def query(page_params):
+            # encode the values like requests does
+            items = []
+            for key, value in page_params:
+                values = value if isinstance(value, (list, tuple)) else [value]
+                items.extend((key, str(v)) for v in values if v is not None)
+            return items
+
+        async def get_page(session, url, page_params, proxy):
+            async with session.get(
+                url, params=query(page_params), proxy=proxy
+            ) as response:
+                content = await response.read()
+                if response.status >= 400:
+                    raise JIRAError(
+                        response.status,
+                        content.decode("utf-8", "replace"),
+                        str(response.url),
+                    )
+            return json_loads_bytes(content)
+
+        async def get_pages():
+            connector = aiohttp.TCPConnector(
+                limit=self._options["async_workers"], ssl=ssl_context
+            )
+            async with aiohttp.ClientSession(
+                connector=connector,
+                auth=aiohttp.BasicAuth(*auth) if auth else None,
+                headers=dict(self._session.headers),
+                cookies=self._session.cookies.get_dict(),
+                trust_env=self._session.trust_env,
+            ) as session:
+                return await asyncio.gather(
+                    *[
+                        get_page(session, url, params, proxy)
+                        for (url, params), proxy in zip(requests_, proxies)
+                    ]
+                )
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(get_pages())
+        finally:
+            loop.close()
 
     def _get_items_from_page(self, item_type, items_key, resource):
         """
@@ -721,14 +1328,15 @@ class JIRA(object):
         :type resource: Dict[str, Any]
         :rtype: Union[List[Dashboard], List[Issue]]
         """
-        try:
-            return [
-                item_type(self._options, self._session, raw_issue_json)
-                for raw_issue_json in (resource[items_key] if items_key else resource)
-            ]
-        except KeyError as e:
-            # improving the error text so we know why it happened
-            raise KeyError(str(e) + " : " + json.dumps(resource))
+        if items_key:
+            try:
+                raws = resource[items_key]
+            except KeyError as e:
+                # improving the error text so we know why it happened
+                raise KeyError(str(e) + " : " + json.dumps(resource))
+        else:
+            raws = resource
+        return item_type.from_raw_batch(self._options, self._session, raws)
 
     # Information about this client
 
@@ -766,14 +1374,29 @@ class JIRA(object):
     def async_do(self, size=10):
         """Execute all asynchronous jobs and wait for them to finish. By default it will run on 10 threads.
 
+        The threads are kept for the next calls with the same size.
+
         :param size: number of threads to run on.
         """
-        if hasattr(self._session, "_async_jobs"):
+        jobs = getattr(self._session, "_async_jobs", None)
+        if jobs:
             logging.info(
-                "Executing asynchronous %s jobs found in queue by using %s threads..."
-                % (len(self._session._async_jobs), size)
+                "Executing asynchronous %s jobs found in queue by using %s threads...",
+                len(jobs),
+                size,
+            )
+            self._session._async_jobs = []
+            self._mount_adapters(size)
+            if self._async_do_executor is None or self._async_do_size != size:
+                if self._async_do_executor is not None:
+                    self._async_do_executor.shutdown(wait=False)
+                self._async_do_executor = ThreadPoolExecutor(max_workers=size)
+                self._async_do_size = size
+            # consuming the results waits for all the jobs, and raises the
+            # first error
+            list(
+                self._async_do_executor.map(lambda job: job[0](job[1], **job[2]), jobs)
             )
-            threaded_requests.map(self._session._async_jobs, size=size)
 
             # Application properties
 
@@ -799,21 +1422,29 @@ class JIRA(object):
         :param value: value to assign to the property
         :type value: str
         """
-        url = self._options["server"] + "/rest/api/latest/application-properties/" + key
+        url = "%s/application-properties/%s" % (self._rest_api_url, key)
         payload = {"id": key, "value": value}
-        return self._session.put(url, data=json.dumps(payload))
+        return self._session.put(url, data=json_dumps(payload))
 
-    def applicationlinks(self, cached=True):
+    def applicationlinks(self, cached=True, ttl=300):
         """List of application links.
 
+        :param cached: whether to return the last result, if it is recent enough (Default: True)
+        :type cached: bool
+        :param ttl: number of seconds during which the last result is reused. (Default: 300)
+        :type ttl: float
         :return: json
         """
-        # if cached, return the last result
-        if cached and hasattr(self, "_applicationlinks"):
+        # if cached, return the last result while it is fresh
+        if (
+            cached
+            and hasattr(self, "_applicationlinks")
+            and time.monotonic() - self._applicationlinks_ts < ttl
+        ):
             return self._applicationlinks
 
         # url = self._options['server'] + '/rest/applinks/latest/applicationlink'
-        url = self._options["server"] + "/rest/applinks/latest/listApplicationlinks"
+        url = self._applinks_url + "/listApplicationlinks"
 
         r = self._session.get(url)
 
@@ -822,6 +1453,11 @@ class JIRA(object):
             self._applicationlinks = o["list"]
         else:
             self._applicationlinks = []
+        # the first link wins when several have the same url
+        self._applicationlinks_by_url = {
+            x["application"]["displayUrl"]: x for x in reversed(self._applicationlinks)
+        }
+        self._applicationlinks_ts = time.monotonic()
         return self._applicationlinks
 
     # Attachments
@@ -867,17 +1503,18 @@ class JIRA(object):
             and attachment.mode != "rb"
         ):
             logging.warning(
-                "%s was not opened in 'rb' mode, attaching file may fail."
-                % attachment.name
+                "%s was not opened in 'rb' mode, attaching file may fail.",
+                attachment.name,
             )
 
-        url = self._get_url("issue/" + str(issue) + "/attachments")
+        url = self._get_url("issue/%s/attachments" % issue)
 
         fname = filename
         if not fname:
             fname = os.path.basename(attachment.name)
 
-        if "MultipartEncoder" not in globals():
+        MultipartEncoder = _get_multipart_encoder()
+        if MultipartEncoder is None:
             method = "old"
             r = self._session.post(
                 url,
@@ -889,11 +1526,19 @@ class JIRA(object):
         else:
             method = "MultipartEncoder"
 
+            # MultipartEncoder reads the file while the request is sent, and
+            # requests sets the Content-Length from its len
+            seekable = getattr(attachment, "seekable", None)
+            start = attachment.tell() if seekable and seekable() else None
+
             def file_stream():
                 """Returns files stream of attachment.
 
                 :rtype: MultipartEncoder
                 """
+                if start is not None:
+                    # rewind what a failed attempt has already sent
+                    attachment.seek(start)
                 return MultipartEncoder(
                     fields={"file": (fname, attachment, "application/octet-stream")}
                 )
@@ -925,7 +1570,7 @@ class JIRA(object):
         :param id: ID of the attachment to delete
         :type id: str
         """
-        url = self._get_url("attachment/" + str(id))
+        url = self._get_url("attachment/%s" % id)
         return self._session.delete(url)
 
     # Components
@@ -965,19 +1610,20 @@ class JIRA(object):
         :rtype: Component
         """
         data = {
-            "name": name,
-            "project": project,
-            "isAssigneeTypeValid": isAssigneeTypeValid,
+            k: v
+            for k, v in (
+                ("name", name),
+                ("project", project),
+                ("description", description),
+                ("leadUserName", leadUserName),
+                ("assigneeType", assigneeType),
+            )
+            if v is not None
         }
-        if description is not None:
-            data["description"] = description
-        if leadUserName is not None:
-            data["leadUserName"] = leadUserName
-        if assigneeType is not None:
-            data["assigneeType"] = assigneeType
+        data["isAssigneeTypeValid"] = isAssigneeTypeValid
 
         url = self._get_url("component")
-        r = self._session.post(url, data=json.dumps(data))
+        r = self._session.post(url, data=json_dumps(data))
 
         component = Component(self._options, self._session, raw=json_loads(r))
         return component
@@ -988,7 +1634,7 @@ class JIRA(object):
         :type id: integer
         :param id: ID of the component to use
         """
-        return self._get_json("component/" + id + "/relatedIssueCounts")["issueCount"]
+        return self._get_json("component/%s/relatedIssueCounts" % id)["issueCount"]
 
     def delete_component(self, id):
         """Delete component by id.
@@ -997,7 +1643,7 @@ class JIRA(object):
         :type id: str
         :rtype: Response
         """
-        url = self._get_url("component/" + str(id))
+        url = self._get_url("component/%s" % id)
         return self._session.delete(url)
 
     # Custom field options
@@ -1050,7 +1696,12 @@ class JIRA(object):
 
         :rtype: List[Dict[str, Any]]
         """
-        return self._get_json("field")
+        cache = self._get_server_cache()
+        if cache is None:
+            return self._get_json("field")
+        if "fields" not in cache:
+            cache["fields"] = self._get_json("field")
+        return cache["fields"]
 
     # Filters
 
@@ -1089,17 +1740,18 @@ class JIRA(object):
         :rtype: Filter
 
         """
-        data = {}
-        if name is not None:
-            data["name"] = name
-        if description is not None:
-            data["description"] = description
-        if jql is not None:
-            data["jql"] = jql
-        if favourite is not None:
-            data["favourite"] = favourite
+        data = {
+            k: v
+            for k, v in (
+                ("name", name),
+                ("description", description),
+                ("jql", jql),
+                ("favourite", favourite),
+            )
+            if v is not None
+        }
         url = self._get_url("filter")
-        r = self._session.post(url, data=json.dumps(data))
+        r = self._session.post(url, data=json_dumps(data))
 
         raw_filter_json = json_loads(r)
         return Filter(self._options, self._session, raw=raw_filter_json)
@@ -1128,10 +1780,10 @@ class JIRA(object):
 
         url = self._get_url("filter/%s" % filter_id)
         r = self._session.put(
-            url, headers={"content-type": "application/json"}, data=json.dumps(data)
+            url, headers={"content-type": "application/json"}, data=json_dumps(data)
         )
 
-        raw_filter_json = json.loads(r.text)
+        raw_filter_json = json_loads(r)
         return Filter(self._options, self._session, raw=raw_filter_json)
 
     # Groups
@@ -1166,17 +1818,17 @@ class JIRA(object):
         :rtype: List[str]
 
         """
-        params = {}
-        groups = []
-        if query is not None:
-            params["query"] = query
-        if exclude is not None:
-            params["exclude"] = exclude
-        if maxResults is not None:
-            params["maxResults"] = maxResults
-        for group in self._get_json("groups/picker", params=params)["groups"]:
-            groups.append(group["name"])
-        return sorted(groups)
+        params = {
+            k: v
+            for k, v in (
+                ("query", query),
+                ("exclude", exclude),
+                ("maxResults", maxResults),
+            )
+            if v is not None
+        }
+        groups = self._get_json("groups/picker", params=params)["groups"]
+        return sorted(group["name"] for group in groups)
 
     def group_members(self, group):
         """Return a hash or users with their information. Requires Jira 6.0 or will raise NotImplemented.
@@ -1193,26 +1845,43 @@ class JIRA(object):
         r = self._get_json("group", params=params)
         size = r["users"]["size"]
         end_index = r["users"]["end-index"]
+        # the server decides how many users are in a page
+        page_size = max(end_index + 1, 1)
 
-        while end_index < size - 1:
+        def get_users(start_index):
             params = {
                 "groupname": group,
-                "expand": "users[%s:%s]" % (end_index + 1, end_index + 50),
+                "expand": "users[%s:%s]" % (start_index, start_index + page_size - 1),
             }
-            r2 = self._get_json("group", params=params)
-            for user in r2["users"]["items"]:
-                r["users"]["items"].append(user)
-            end_index = r2["users"]["end-index"]
-            size = r["users"]["size"]
+            return self._get_json("group", params=params)["users"]
 
         result = {}
-        for user in r["users"]["items"]:
-            result[user["key"]] = {
-                "name": user["name"],
-                "fullname": user["displayName"],
-                "email": user.get("emailAddress", "hidden"),
-                "active": user["active"],
-            }
+
+        def add_page(users):
+            for user in users:
+                result[user["key"]] = {
+                    "name": user["name"],
+                    "fullname": user["displayName"],
+                    "email": user.get("emailAddress", "hidden"),
+                    "active": user["active"],
+                }
+
+        # the size is known from the first page, the other ones can be
+        # requested independently
+        add_page(r["users"]["items"])
+        starts = range(end_index + 1, size, page_size)
+        for start_index, users in zip(starts, self._map(get_users, starts)):
+            add_page(users["items"])
+            last_index = min(start_index + page_size, size) - 1
+            # a page shorter than asked for leaves a gap before the next one,
+            # which is read in sequence like the server pages it
+            end_index = users["end-index"]
+            while start_index <= end_index < last_index:
+                start_index = end_index + 1
+                users = get_users(start_index)
+                add_page(users["items"])
+                end_index = users["end-index"]
+
         return OrderedDict(sorted(result.items(), key=lambda t: t[0]))
 
     def add_group(self, groupname):
@@ -1223,16 +1892,12 @@ class JIRA(object):
         :return: Boolean - True if successful.
         :rtype: bool
         """
-        url = self._options["server"] + "/rest/api/latest/group"
+        url = self._rest_api_url + "/group"
 
         # implementation based on
         # https://docs.atlassian.com/jira/REST/ondemand/#d2e5173
 
-        x = OrderedDict()
-
-        x["name"] = groupname
-
-        payload = json.dumps(x)
+        payload = json_dumps({"name": groupname})
 
         self._session.post(url, data=payload)
 
@@ -1248,7 +1913,7 @@ class JIRA(object):
         """
         # implementation based on
         # https://docs.atlassian.com/jira/REST/ondemand/#d2e5173
-        url = self._options["server"] + "/rest/api/latest/group"
+        url = self._rest_api_url + "/group"
         x = {"groupname": groupname}
         self._session.delete(url, params=x)
         return True
@@ -1304,19 +1969,10 @@ class JIRA(object):
         """
         data = _field_worker(fields, **fieldargs)
 
-        p = data["fields"]["project"]
-
-        if isinstance(p, str) or isinstance(p, int):
-            data["fields"]["project"] = {"id": self.project(p).id}
-
-        p = data["fields"]["issuetype"]
-        if isinstance(p, int):
-            data["fields"]["issuetype"] = {"id": p}
-        if isinstance(p, str) or isinstance(p, int):
-            data["fields"]["issuetype"] = {"id": self.issue_type_by_name(p).id}
+        self._resolve_project_and_issuetype(data["fields"])
 
         url = self._get_url("issue")
-        r = self._session.post(url, data=json.dumps(data))
+        r = self._session.post(url, data=json_dumps(data))
 
         raw_issue_json = json_loads(r)
         if "key" not in raw_issue_json:
@@ -1340,31 +1996,30 @@ class JIRA(object):
         :rtype: List[Dict[str, Any]]
 
         """
-        data = {"issueUpdates": []}
-        for field_dict in field_list:
-            issue_data = _field_worker(field_dict)
-            p = issue_data["fields"]["project"]
-
-            if isinstance(p, str) or isinstance(p, int):
-                issue_data["fields"]["project"] = {"id": self.project(p).id}
-
-            p = issue_data["fields"]["issuetype"]
-            if isinstance(p, int):
-                issue_data["fields"]["issuetype"] = {"id": p}
-            if isinstance(p, str) or isinstance(p, int):
-                issue_data["fields"]["issuetype"] = {
-                    "id": self.issue_type_by_name(p).id
-                }
-
-            data["issueUpdates"].append(issue_data)
+        data = {"issueUpdates": [_field_worker(fields) for fields in field_list]}
+        type_names = {
+            issue_data["fields"]["issuetype"]
+            for issue_data in data["issueUpdates"]
+            if isinstance(issue_data["fields"]["issuetype"], str)
+        }
+        if not type_names.issubset(self._issue_type_ids):
+            # One listing of the issue types serves every row, instead of a
+            # lookup for each new name. The first issue type wins when several
+            # have the same name, as in issue_type_by_name().
+            issue_types = {it.name: it.id for it in reversed(self.issue_types())}
+            with self._ids_lock:
+                self._issue_type_ids.update(issue_types)
+        for issue_data in data["issueUpdates"]:
+            self._resolve_project_and_issuetype(issue_data["fields"])
 
         url = self._get_url("issue/bulk")
         try:
-            r = self._session.post(url, data=json.dumps(data))
+            r = self._session.post(url, data=json_dumps(data))
             raw_issue_json = json_loads(r)
         # Catching case where none of the issues has been created. See https://github.com/pycontribs/jira/issues/350
         except JIRAError as je:
             if je.status_code == 400:
+                # json_loads() would raise the error of the response again
                 raw_issue_json = json.loads(je.response.text)
             else:
                 raise
@@ -1372,6 +2027,15 @@ class JIRA(object):
         errors = {}
         for error in raw_issue_json["errors"]:
             errors[error["failedElementNumber"]] = error["elementErrors"]["errors"]
+        created_issues = raw_issue_json["issues"]
+        if prefetch:
+            created_issues = self._reload_created_issues(created_issues)
+        else:
+            created_issues = [
+                Issue(self._options, self._session, raw=issue)
+                for issue in created_issues
+            ]
+        created_issues = iter(created_issues)
         for index, fields in enumerate(field_list):
             if index in errors:
                 issue_list.append(
@@ -1383,28 +2047,80 @@ class JIRA(object):
                     }
                 )
             else:
-                issue = raw_issue_json["issues"].pop(0)
-                if prefetch:
-                    issue = self.issue(issue["key"])
-                else:
-                    issue = Issue(self._options, self._session, raw=issue)
                 issue_list.append(
                     {
                         "status": "Success",
-                        "issue": issue,
+                        "issue": next(created_issues),
                         "error": None,
                         "input_fields": fields,
                     }
                 )
         return issue_list
 
+    def _resolve_project_and_issuetype(self, fields):
+        """Replace the project key or id and the issue type name of new issue fields by references.
+
+        The ids are looked up once per project and issue type name and kept for the
+        lifetime of the client, so creating many issues does not look them up again.
+        An int issue type is used as its id.
+
+        :type fields: Dict[str, Any]
+        """
+        p = fields["project"]
+        if isinstance(p, (str, int)):
+            with self._ids_lock:
+                project_id = self._project_ids.get(p)
+            if project_id is None:
+                project_id = self.project(p).id
+                with self._ids_lock:
+                    self._project_ids[p] = project_id
+            fields["project"] = {"id": project_id}
+
+        p = fields["issuetype"]
+        if isinstance(p, int):
+            fields["issuetype"] = {"id": p}
+        elif isinstance(p, str):
+            with self._ids_lock:
+                issue_type_id = self._issue_type_ids.get(p)
+            if issue_type_id is None:
+                issue_type_id = self.issue_type_by_name(p).id
+                with self._ids_lock:
+                    self._issue_type_ids[p] = issue_type_id
+            fields["issuetype"] = {"id": issue_type_id}
+
+    def _reload_created_issues(self, raw_issues):
+        """Get the full representation of issues from the response of a bulk creation.
+
+        The issues are searched for by batches of keys, instead of getting them one
+        by one. Those not found by the search, which may not be indexed yet, are
+        requested individually.
+
+        :param raw_issues: The issues returned by the creation.
+        :type raw_issues: List[Dict[str, Any]]
+        :rtype: List[Issue]
+        """
+        keys = [issue["key"] for issue in raw_issues if "fields" not in issue]
+        found = {}
+        for start in range(0, len(keys), 100):
+            jql = "key in (%s)" % ",".join(keys[start : start + 100])
+            for issue in self.search_issues(jql, maxResults=False, fields="*all"):
+                found[issue.key] = issue
+        issues = []
+        for raw_issue in raw_issues:
+            if "fields" in raw_issue:
+                issue = Issue(self._options, self._session, raw=raw_issue)
+            else:
+                issue = found.get(raw_issue["key"]) or self.issue(raw_issue["key"])
+            issues.append(issue)
+        return issues
+
     def supports_service_desk(self):
         """Returns whether or not the Jira instance supports service desk.
 
         :rtype: bool
         """
-        url = self._options["server"] + "/rest/servicedeskapi/info"
-        headers = {"X-ExperimentalApi": "opt-in"}
+        url = self._servicedesk_url + "/info"
+        headers = _SERVICE_DESK_HEADERS
         try:
             r = self._session.get(url, headers=headers)
             return r.status_code == 200
@@ -1421,12 +2137,12 @@ class JIRA(object):
         :rtype: Customer
 
         """
-        url = self._options["server"] + "/rest/servicedeskapi/customer"
-        headers = {"X-ExperimentalApi": "opt-in"}
+        url = self._servicedesk_url + "/customer"
+        headers = _SERVICE_DESK_HEADERS
         r = self._session.post(
             url,
             headers=headers,
-            data=json.dumps({"email": email, "displayName": displayName}),
+            data=json_dumps({"email": email, "displayName": displayName}),
         )
 
         raw_customer_json = json_loads(r)
@@ -1441,10 +2157,9 @@ class JIRA(object):
         :rtype: List[ServiceDesk]
 
         """
-        url = self._options["server"] + "/rest/servicedeskapi/servicedesk"
-        headers = {"X-ExperimentalApi": "opt-in"}
+        url = self._servicedesk_url + "/servicedesk"
+        headers = _SERVICE_DESK_HEADERS
         r_json = json_loads(self._session.get(url, headers=headers))
-        print(r_json)
         projects = [
             ServiceDesk(self._options, self._session, raw_project_json)
             for raw_project_json in r_json["values"]
@@ -1488,7 +2203,7 @@ class JIRA(object):
         p = data["serviceDeskId"]
         service_desk = None
 
-        if isinstance(p, str) or isinstance(p, int):
+        if isinstance(p, (str, int)):
             service_desk = self.service_desk(p)
         elif isinstance(p, ServiceDesk):
             service_desk = p
@@ -1496,14 +2211,12 @@ class JIRA(object):
         data["serviceDeskId"] = service_desk.id
 
         p = data["requestTypeId"]
-        if isinstance(p, int):
-            data["requestTypeId"] = p
-        elif isinstance(p, str):
+        if isinstance(p, str):
             data["requestTypeId"] = self.request_type_by_name(service_desk, p).id
 
-        url = self._options["server"] + "/rest/servicedeskapi/request"
-        headers = {"X-ExperimentalApi": "opt-in"}
-        r = self._session.post(url, headers=headers, data=json.dumps(data))
+        url = self._servicedesk_url + "/request"
+        headers = _SERVICE_DESK_HEADERS
+        r = self._session.post(url, headers=headers, data=json_dumps(data))
 
         raw_issue_json = json_loads(r)
         if "issueKey" not in raw_issue_json:
@@ -1560,11 +2273,22 @@ class JIRA(object):
         return self._get_json("issue/createmeta", params)
 
     def _get_user_accountid(self, user):
-        """Internal method for translating an user to an accountId."""
+        """Internal method for translating an user to an accountId.
+
+        The accountIds of the most recently used users are remembered.
+        """
+        with self._ids_lock:
+            if user in self._account_ids:
+                self._account_ids.move_to_end(user)
+                return self._account_ids[user]
         try:
             accountId = self.search_users(user, maxResults=1)[0].accountId
         except Exception as e:
             raise JIRAError(e)
+        with self._ids_lock:
+            self._account_ids[user] = accountId
+            if len(self._account_ids) > _ACCOUNT_IDS_SIZE:
+                self._account_ids.popitem(last=False)
         return accountId
 
     # non-resource
@@ -1579,32 +2303,42 @@ class JIRA(object):
 
         :rtype: bool
         """
-        url = (
-            self._options["server"]
-            + "/rest/api/latest/issue/"
-            + str(issue)
-            + "/assignee"
-        )
+        url = self._rest_api_url + "/issue/%s/assignee" % issue
         payload = {"accountId": self._get_user_accountid(assignee)}
         # 'key' and 'name' are deprecated in favor of accountId
-        r = self._session.put(url, data=json.dumps(payload))
+        r = self._session.put(url, data=json_dumps(payload))
         raise_on_error(r)
         return True
 
     @translate_resource_args
-    def comments(self, issue):
+    def comments(self, issue, startAt=0, maxResults=None):
         """Get a list of comment Resources.
 
         :param issue: the issue to get comments from
         :type issue: str
+        :param startAt: index of the first comment to return (Default: 0)
+        :type startAt: int
+        :param maxResults: maximum number of comments to return.
+            If maxResults evaluates as False, it will try to get all comments in batches.
+            By default the comments of the first page returned by the server are returned.
+        :type maxResults: Optional[int]
         :rtype: List[Comment]
         """
-        r_json = self._get_json("issue/" + str(issue) + "/comment")
-
-        comments = [
-            Comment(self._options, self._session, raw_comment_json)
-            for raw_comment_json in r_json["comments"]
-        ]
+        if startAt or maxResults is not None:
+            comments = self._fetch_pages(
+                Comment,
+                "comments",
+                "issue/%s/comment" % issue,
+                startAt,
+                maxResults,
+            )
+        else:
+            raw_comments = self._iter_json_array("issue/%s/comment" % issue, "comments")
+            comments = [
+                Comment(self._options, self._session, raw_comment_json)
+                for raw_comment_json in raw_comments
+            ]
+        self._keep_sub_resources("comment", issue, comments)
         return comments
 
     @translate_resource_args
@@ -1614,6 +2348,9 @@ class JIRA(object):
         :param issue: ID or key of the issue to get the comment from
         :param comment: ID of the comment to get
         """
+        listed = self._get_sub_resource("comment", issue, comment)
+        if listed is not None:
+            return listed
         return self._find_for_resource(Comment, (issue, comment))
 
     @translate_resource_args
@@ -1650,8 +2387,9 @@ class JIRA(object):
         if visibility is not None:
             data["visibility"] = visibility
 
-        url = self._get_url("issue/" + str(issue) + "/comment")
-        r = self._session.post(url, data=json.dumps(data))
+        url = self._get_url("issue/%s/comment" % issue)
+        self._sub_resources.pop(("comment", str(issue)), None)
+        r = self._session.post(url, data=json_dumps(data))
 
         comment = Comment(self._options, self._session, raw=json_loads(r))
         return comment
@@ -1665,7 +2403,7 @@ class JIRA(object):
         :rtype: Dict[str, Dict[str, Dict[str, Any]]]
 
         """
-        return self._get_json("issue/" + str(issue) + "/editmeta")
+        return self._get_json_revalidated("issue/%s/editmeta" % issue)
 
     @translate_resource_args
     def remote_links(self, issue):
@@ -1673,11 +2411,12 @@ class JIRA(object):
 
         :param issue: the issue to get remote links from
         """
-        r_json = self._get_json("issue/" + str(issue) + "/remotelink")
+        raw_remote_links = self._iter_json_array("issue/%s/remotelink" % issue)
         remote_links = [
             RemoteLink(self._options, self._session, raw_remotelink_json)
-            for raw_remotelink_json in r_json
+            for raw_remotelink_json in raw_remote_links
         ]
+        self._keep_sub_resources("remotelink", issue, remote_links)
         return remote_links
 
     @translate_resource_args
@@ -1687,6 +2426,9 @@ class JIRA(object):
         :param issue: the issue holding the remote link
         :param id: ID of the remote link
         """
+        listed = self._get_sub_resource("remotelink", issue, id)
+        if listed is not None:
+            return listed
         return self._find_for_resource(RemoteLink, (issue, id))
 
     # removed the @translate_resource_args because it prevents us from finding
@@ -1708,36 +2450,40 @@ class JIRA(object):
         :param application: application information for the link (see the above link for details)
         :param relationship: relationship description for the link (see the above link for details)
         """
-        try:
-            applicationlinks = self.applicationlinks()
-        except JIRAError as e:
-            applicationlinks = []
-            # In many (if not most) configurations, non-admin users are
-            # not allowed to list applicationlinks; if we aren't allowed,
-            # let's let people try to add remote links anyway, we just
-            # won't be able to be quite as helpful.
-            warnings.warn(
-                "Unable to gather applicationlinks; you will not be able "
-                "to add links to remote issues: (%s) %s" % (e.status_code, e.text),
-                Warning,
-            )
+        applicationlinks = {}
+        # the application links are only used to identify linked resources,
+        # a plain link object does not need them
+        if hasattr(destination, "raw"):
+            try:
+                self.applicationlinks()
+                applicationlinks = self._applicationlinks_by_url
+            except JIRAError as e:
+                # In many (if not most) configurations, non-admin users are
+                # not allowed to list applicationlinks; if we aren't allowed,
+                # let's let people try to add remote links anyway, we just
+                # won't be able to be quite as helpful.
+                warnings.warn(
+                    "Unable to gather applicationlinks; you will not be able "
+                    "to add links to remote issues: (%s) %s" % (e.status_code, e.text),
+                    Warning,
+                    stacklevel=2,
+                )
 
         data = {}
         if isinstance(destination, Issue):
 
             data["object"] = {"title": str(destination), "url": destination.permalink()}
 
-            for x in applicationlinks:
-                if x["application"]["displayUrl"] == destination._options["server"]:
-                    data["globalId"] = "appId=%s&issueId=%s" % (
-                        x["application"]["id"],
-                        destination.raw["id"],
-                    )
-                    data["application"] = {
-                        "name": x["application"]["name"],
-                        "type": "com.atlassian.jira",
-                    }
-                    break
+            x = applicationlinks.get(destination._options["server"])
+            if x is not None:
+                data["globalId"] = "appId=%s&issueId=%s" % (
+                    x["application"]["id"],
+                    destination.raw["id"],
+                )
+                data["application"] = {
+                    "name": x["application"]["name"],
+                    "type": "com.atlassian.jira",
+                }
             if "globalId" not in data:
                 raise NotImplementedError("Unable to identify the issue to link to.")
         else:
@@ -1752,20 +2498,20 @@ class JIRA(object):
             data["relationship"] = relationship
 
         # check if the link comes from one of the configured application links
-        for x in applicationlinks:
-            if x["application"]["displayUrl"] == self._options["server"]:
-                data["globalId"] = "appId=%s&issueId=%s" % (
-                    x["application"]["id"],
-                    destination.raw["id"],
-                )
-                data["application"] = {
-                    "name": x["application"]["name"],
-                    "type": "com.atlassian.jira",
-                }
-                break
+        x = applicationlinks.get(self._options["server"])
+        if x is not None:
+            data["globalId"] = "appId=%s&issueId=%s" % (
+                x["application"]["id"],
+                destination.raw["id"],
+            )
+            data["application"] = {
+                "name": x["application"]["name"],
+                "type": "com.atlassian.jira",
+            }
 
-        url = self._get_url("issue/" + str(issue) + "/remotelink")
-        r = self._session.post(url, data=json.dumps(data))
+        url = self._get_url("issue/%s/remotelink" % issue)
+        self._sub_resources.pop(("remotelink", str(issue)), None)
+        r = self._session.post(url, data=json_dumps(data))
 
         remote_link = RemoteLink(self._options, self._session, raw=json_loads(r))
         return remote_link
@@ -1786,8 +2532,9 @@ class JIRA(object):
         :param object: the dictionary used to create remotelink data
         """
         data = {"object": object}
-        url = self._get_url("issue/" + str(issue) + "/remotelink")
-        r = self._session.post(url, data=json.dumps(data))
+        url = self._get_url("issue/%s/remotelink" % issue)
+        self._sub_resources.pop(("remotelink", str(issue)), None)
+        r = self._session.post(url, data=json_dumps(data))
 
         simple_link = RemoteLink(self._options, self._session, raw=json_loads(r))
         return simple_link
@@ -1806,7 +2553,7 @@ class JIRA(object):
             params["transitionId"] = id
         if expand is not None:
             params["expand"] = expand
-        return self._get_json("issue/" + str(issue) + "/transitions", params=params)[
+        return self._get_json("issue/%s/transitions" % issue, params=params)[
             "transitions"
         ]
 
@@ -1815,17 +2562,28 @@ class JIRA(object):
 
         Look at https://developer.atlassian.com/static/rest/jira/6.1.html#d2e1074 for json reference
 
+        The transitions of an issue are reused for a few seconds, until the issue is transitioned.
+
         :param issue: ID or key of the issue to get the transitions from
         :param trans_name: iname of transition we are looking for
         """
-        transitions_json = self.transitions(issue)
-        id = None
-
-        for transition in transitions_json:
-            if transition["name"].lower() == transition_name.lower():
-                id = transition["id"]
-                break
-        return id
+        key = str(issue)
+        with self._ids_lock:
+            cached = self._transitions_cache.get(key)
+            if cached is not None:
+                self._transitions_cache.move_to_end(key)
+        if cached is None or time.monotonic() - cached[0] >= _TRANSITIONS_TTL:
+            # the first transition wins when several have the same name
+            ids = {}
+            for transition in reversed(self.transitions(issue)):
+                ids[transition["name"].casefold()] = transition["id"]
+            cached = (time.monotonic(), ids)
+            with self._ids_lock:
+                self._transitions_cache[key] = cached
+                self._transitions_cache.move_to_end(key)
+                if len(self._transitions_cache) > _TRANSITIONS_SIZE:
+                    self._transitions_cache.popitem(last=False)
+        return cached[1].get(transition_name.casefold())
 
     @translate_resource_args
     def transition_issue(
@@ -1844,11 +2602,9 @@ class JIRA(object):
         :param fields: a dict containing field names and the values to use.
             If present, all other keyword arguments will be ignored
         """
-        transitionId = None
-
         try:
             transitionId = int(transition)
-        except Exception:
+        except (TypeError, ValueError):
             # cannot cast to int, so try to find transitionId by name
             transitionId = self.find_transitionid_by_name(issue, transition)
             if transitionId is None:
@@ -1867,12 +2623,15 @@ class JIRA(object):
                 fields_dict[field] = fieldargs[field]
             data["fields"] = fields_dict
 
-        url = self._get_url("issue/" + str(issue) + "/transitions")
-        r = self._session.post(url, data=json.dumps(data))
+        url = self._get_url("issue/%s/transitions" % issue)
+        r = self._session.post(url, data=json_dumps(data))
+        # the issue is in a new status, which has its own transitions
+        with self._ids_lock:
+            self._transitions_cache.pop(str(issue), None)
         try:
             r_json = json_loads(r)
         except ValueError as e:
-            logging.error("%s\n%s" % (e, r.text))
+            logging.error("%s\n%s", e, r.text)
             raise e
         return r_json
 
@@ -1892,7 +2651,7 @@ class JIRA(object):
         :param issue: ID or key of the issue to vote on
         :rtype: Response
         """
-        url = self._get_url("issue/" + str(issue) + "/votes")
+        url = self._get_url("issue/%s/votes" % issue)
         return self._session.post(url)
 
     @translate_resource_args
@@ -1901,7 +2660,7 @@ class JIRA(object):
 
         :param issue: ID or key of the issue to remove vote on
         """
-        url = self._get_url("issue/" + str(issue) + "/votes")
+        url = self._get_url("issue/%s/votes" % issue)
         self._session.delete(url)
 
     @translate_resource_args
@@ -1920,8 +2679,26 @@ class JIRA(object):
         :param issue: ID or key of the issue affected
         :param watcher: username of the user to add to the watchers list
         """
-        url = self._get_url("issue/" + str(issue) + "/watchers")
-        self._session.post(url, data=json.dumps(watcher))
+        url = self._get_url("issue/%s/watchers" % issue)
+        self._session.post(url, data=json_dumps(watcher))
+
+    @translate_resource_args
+    def add_watchers(self, issue, watchers):
+        """Add several users to an issue's watchers list.
+
+        Jira adds watchers one at a time, so a request is sent for each of them. They are
+        sent concurrently when the ``async`` option is set, and the rate limits returned
+        by the server apply to all of them.
+
+        :param issue: ID or key of the issue affected
+        :param watchers: usernames of the users to add to the watchers list
+        :type watchers: Iterable[str]
+        """
+        url = self._get_url("issue/%s/watchers" % issue)
+        self._map(
+            lambda watcher: self._session.post(url, data=json_dumps(watcher)),
+            watchers,
+        )
 
     @translate_resource_args
     def remove_watcher(self, issue, watcher):
@@ -1931,23 +2708,39 @@ class JIRA(object):
         :param watcher: accountId of the user to remove from the watchers list
         :rtype: Response
         """
-        url = self._get_url("issue/" + str(issue) + "/watchers")
+        url = self._get_url("issue/%s/watchers" % issue)
         params = {"accountId": watcher}
         result = self._session.delete(url, params=params)
         return result
 
     @translate_resource_args
-    def worklogs(self, issue):
+    def worklogs(self, issue, startAt=0, maxResults=None):
         """Get a list of worklog Resources from the server for an issue.
 
         :param issue: ID or key of the issue to get worklogs from
+        :param startAt: index of the first worklog to return (Default: 0)
+        :type startAt: int
+        :param maxResults: maximum number of worklogs to return.
+            If maxResults evaluates as False, it will try to get all worklogs in batches.
+            By default the worklogs of the first page returned by the server are returned.
+        :type maxResults: Optional[int]
         :rtype: List[Worklog]
         """
-        r_json = self._get_json("issue/" + str(issue) + "/worklog")
-        worklogs = [
-            Worklog(self._options, self._session, raw_worklog_json)
-            for raw_worklog_json in r_json["worklogs"]
-        ]
+        if startAt or maxResults is not None:
+            worklogs = self._fetch_pages(
+                Worklog,
+                "worklogs",
+                "issue/%s/worklog" % issue,
+                startAt,
+                maxResults,
+            )
+        else:
+            raw_worklogs = self._iter_json_array("issue/%s/worklog" % issue, "worklogs")
+            worklogs = [
+                Worklog(self._options, self._session, raw_worklog_json)
+                for raw_worklog_json in raw_worklogs
+            ]
+        self._keep_sub_resources("worklog", issue, worklogs)
         return worklogs
 
     @translate_resource_args
@@ -1958,6 +2751,9 @@ class JIRA(object):
         :param id: ID of the worklog to get
         :rtype: Worklog
         """
+        listed = self._get_sub_resource("worklog", issue, id)
+        if listed is not None:
+            return listed
         return self._find_for_resource(Worklog, (issue, id))
 
     @translate_resource_args
@@ -2006,10 +2802,16 @@ class JIRA(object):
 
         if started is not None:
             # based on REST Browser it needs: "2014-06-03T08:21:01.273+0000"
-            if started.tzinfo is None:
-                data["started"] = started.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
-            else:
-                data["started"] = started.strftime("%Y-%m-%dT%H:%M:%S.000%z")
+            # formatting the fields directly is about twice as fast as strftime
+            data["started"] = "%04d-%02d-%02dT%02d:%02d:%02d.000%s" % (
+                started.year,
+                started.month,
+                started.day,
+                started.hour,
+                started.minute,
+                started.second,
+                "+0000" if started.tzinfo is None else started.strftime("%z"),
+            )
         if user is not None:
             data["author"] = {
                 "name": user,
@@ -2020,8 +2822,9 @@ class JIRA(object):
             data["updateAuthor"] = data["author"]
         # report bug to Atlassian: author and updateAuthor parameters are
         # ignored.
-        url = self._get_url("issue/{0}/worklog".format(issue))
-        r = self._session.post(url, params=params, data=json.dumps(data))
+        url = self._get_url("issue/%s/worklog" % issue)
+        self._sub_resources.pop(("worklog", str(issue)), None)
+        r = self._session.post(url, params=params, data=json_dumps(data))
 
         return Worklog(self._options, self._session, json_loads(r))
 
@@ -2045,19 +2848,14 @@ class JIRA(object):
         :rtype: Response
         """
         # let's see if we have the right issue link 'type' and fix it if needed
-        issue_link_types = self.issue_link_types()
-
-        if type not in issue_link_types:
-            for lt in issue_link_types:
-                if lt.outward == type:
-                    # we are smart to figure it out what he meant
-                    type = lt.name
-                    break
-                elif lt.inward == type:
-                    # so that's the reverse, so we fix the request
-                    type = lt.name
-                    inwardIssue, outwardIssue = outwardIssue, inwardIssue
-                    break
+        self.issue_link_types()
+
+        if type in self._issue_link_types_by_direction:
+            # we are smart to figure it out what he meant
+            type, inward = self._issue_link_types_by_direction[type]
+            if inward:
+                # so that's the reverse, so we fix the request
+                inwardIssue, outwardIssue = outwardIssue, inwardIssue
 
         data = {
             "type": {"name": type},
@@ -2066,14 +2864,14 @@ class JIRA(object):
             "comment": comment,
         }
         url = self._get_url("issueLink")
-        return self._session.post(url, data=json.dumps(data))
+        return self._session.post(url, data=json_dumps(data))
 
     def delete_issue_link(self, id):
         """Delete a link between two issues.
 
         :param id: ID of the issue link to delete
         """
-        url = self._get_url("issueLink") + "/" + id
+        url = self._get_url("issueLink/%s" % id)
         return self._session.delete(url)
 
     def issue_link(self, id):
@@ -2088,14 +2886,26 @@ class JIRA(object):
     def issue_link_types(self, force=False):
         """Get a list of issue link type Resources from the server.
 
+        The list is fetched once and kept, unless ``force`` is set.
+
+        :param force: whether to fetch the list again (Default: False)
+        :type force: bool
         :rtype: List[IssueLinkType]
         """
-        if not hasattr(self, "self._cached_issue_link_types") or force:
+        if force or not hasattr(self, "_cached_issue_link_types"):
             r_json = self._get_json("issueLinkType")
-            self._cached_issue_link_types = [
+            link_types = [
                 IssueLinkType(self._options, self._session, raw_link_json)
                 for raw_link_json in r_json["issueLinkTypes"]
             ]
+            # outward or inward description -> (name, whether it is inward);
+            # filled backwards so that the first matching type wins
+            by_direction = {}
+            for lt in reversed(link_types):
+                by_direction[lt.inward] = (lt.name, True)
+                by_direction[lt.outward] = (lt.name, False)
+            self._issue_link_types_by_direction = by_direction
+            self._cached_issue_link_types = link_types
         return self._cached_issue_link_types
 
     def issue_link_type(self, id):
@@ -2116,12 +2926,14 @@ class JIRA(object):
         :rtype: List[IssueType]
 
         """
-        r_json = self._get_json("issuetype")
-        issue_types = [
-            IssueType(self._options, self._session, raw_type_json)
-            for raw_type_json in r_json
-        ]
-        return issue_types
+        issue_types = self._get_metadata(
+            "issuetype",
+            lambda: [
+                IssueType(self._options, self._session, raw_type_json)
+                for raw_type_json in self._get_json_revalidated("issuetype")
+            ],
+        )
+        return list(issue_types)
 
     def issue_type(self, id):
         """Get an issue type Resource from the server.
@@ -2137,12 +2949,15 @@ class JIRA(object):
         :type name: str
         :rtype: IssueType
         """
-        issue_types = self.issue_types()
+        # the first issue type wins when several have the same name
+        issue_types = self._get_metadata(
+            "issuetype-by-name",
+            lambda: {it.name: it for it in reversed(self.issue_types())},
+        )
         try:
-            issue_type = [it for it in issue_types if it.name == name][0]
-        except IndexError:
+            return issue_types[name]
+        except KeyError:
             raise KeyError("Issue type '%s' is unknown." % name)
-        return issue_type
 
     def request_types(self, service_desk):
         """ Returns request types supported by a service desk instance.
@@ -2152,17 +2967,17 @@ class JIRA(object):
         """
         if hasattr(service_desk, "id"):
             service_desk = service_desk.id
-        url = (
-            self._options["server"]
-            + "/rest/servicedeskapi/servicedesk/%s/requesttype" % service_desk
-        )
-        headers = {"X-ExperimentalApi": "opt-in"}
-        r_json = json_loads(self._session.get(url, headers=headers))
-        request_types = [
-            RequestType(self._options, self._session, raw_type_json)
-            for raw_type_json in r_json["values"]
-        ]
-        return request_types
+        url = self._servicedesk_url + "/servicedesk/%s/requesttype" % service_desk
+        headers = _SERVICE_DESK_HEADERS
+
+        def fetch():
+            r_json = json_loads(self._session.get(url, headers=headers))
+            return [
+                RequestType(self._options, self._session, raw_type_json)
+                for raw_type_json in r_json["values"]
+            ]
+
+        return list(self._get_metadata(("requesttype", str(service_desk)), fetch))
 
     def request_type_by_name(self, service_desk, name):
         request_types = self.request_types(service_desk)
@@ -2199,7 +3014,7 @@ class JIRA(object):
             params["issueKey"] = issueKey
         if issueId is not None:
             params["issueId"] = issueId
-        return self._get_json("mypermissions", params=params)
+        return self._get_json_revalidated("mypermissions", params=params)
 
     # Priorities
 
@@ -2209,12 +3024,14 @@ class JIRA(object):
         :rtype: List[Priority]
 
         """
-        r_json = self._get_json("priority")
-        priorities = [
-            Priority(self._options, self._session, raw_priority_json)
-            for raw_priority_json in r_json
-        ]
-        return priorities
+        priorities = self._get_metadata(
+            "priority",
+            lambda: [
+                Priority(self._options, self._session, raw_priority_json)
+                for raw_priority_json in self._get_json_revalidated("priority")
+            ],
+        )
+        return list(priorities)
 
     def priority(self, id):
         """Get a priority Resource from the server.
@@ -2234,12 +3051,14 @@ class JIRA(object):
         :rtype: List[Project]
 
         """
-        r_json = self._get_json("project")
-        projects = [
-            Project(self._options, self._session, raw_project_json)
-            for raw_project_json in r_json
-        ]
-        return projects
+        projects = self._get_metadata(
+            "project",
+            lambda: [
+                Project(self._options, self._session, raw_project_json)
+                for raw_project_json in self._get_json_revalidated("project")
+            ],
+        )
+        return list(projects)
 
     def project(self, id):
         """Get a project Resource from the server.
@@ -2256,7 +3075,7 @@ class JIRA(object):
 
         :param project: ID or key of the project to get avatars for
         """
-        return self._get_json("project/" + project + "/avatars")
+        return self._get_json("project/%s/avatars" % project)
 
     @translate_resource_args
     def create_temp_project_avatar(
@@ -2288,9 +3107,8 @@ class JIRA(object):
             :py:meth:`confirm_project_avatar` with the return value of this method. (Default: False)
         :type auto_confirm: bool
         """
-        size_from_file = os.path.getsize(filename)
-        if size != size_from_file:
-            size = size_from_file
+        # the size given is ignored, the actual size of the file is sent
+        size = _get_file_size(filename, avatar_img)
 
         params = {"filename": filename, "size": size}
 
@@ -2301,7 +3119,7 @@ class JIRA(object):
             # try to detect content-type, this may return None
             headers["content-type"] = self._get_mime_type(avatar_img)
 
-        url = self._get_url("project/" + project + "/avatar/temporary")
+        url = self._get_url("project/%s/avatar/temporary" % project)
         r = self._session.post(url, params=params, headers=headers, data=avatar_img)
 
         cropping_properties = json_loads(r)
@@ -2323,8 +3141,8 @@ class JIRA(object):
         :param cropping_properties: a dict of cropping properties from :py:meth:`create_temp_project_avatar`
         """
         data = cropping_properties
-        url = self._get_url("project/" + project + "/avatar")
-        r = self._session.post(url, data=json.dumps(data))
+        url = self._get_url("project/%s/avatar" % project)
+        r = self._session.post(url, data=json_dumps(data))
 
         return json_loads(r)
 
@@ -2335,7 +3153,7 @@ class JIRA(object):
         :param project: ID or key of the project to set the avatar on
         :param avatar: ID of the avatar to set
         """
-        self._set_avatar(None, self._get_url("project/" + project + "/avatar"), avatar)
+        self._set_avatar(None, self._get_url("project/%s/avatar" % project), avatar)
 
     @translate_resource_args
     def delete_project_avatar(self, project, avatar):
@@ -2344,7 +3162,7 @@ class JIRA(object):
         :param project: ID or key of the project to delete the avatar from
         :param avatar: ID of the avatar to delete
         """
-        url = self._get_url("project/" + project + "/avatar/" + avatar)
+        url = self._get_url("project/%s/avatar/%s" % (project, avatar))
         return self._session.delete(url)
 
     @translate_resource_args
@@ -2355,12 +3173,8 @@ class JIRA(object):
         :type project: str
         :rtype: List[Component]
         """
-        r_json = self._get_json("project/" + project + "/components")
-        components = [
-            Component(self._options, self._session, raw_comp_json)
-            for raw_comp_json in r_json
-        ]
-        return components
+        r_json = self._get_json("project/%s/components" % project)
+        return Component.from_raw_batch(self._options, self._session, r_json)
 
     @translate_resource_args
     def project_versions(self, project):
@@ -2370,12 +3184,8 @@ class JIRA(object):
         :type project: str
         :rtype: List[Version]
         """
-        r_json = self._get_json("project/" + project + "/versions")
-        versions = [
-            Version(self._options, self._session, raw_ver_json)
-            for raw_ver_json in r_json
-        ]
-        return versions
+        r_json = self._get_json("project/%s/versions" % project)
+        return Version.from_raw_batch(self._options, self._session, r_json)
 
     @translate_resource_args
     def get_project_version_by_name(self, project, version_name):
@@ -2387,7 +3197,23 @@ class JIRA(object):
         :type version_name: str
         :rtype: Optional[Version]
         """
-        versions = self.project_versions(project)
+        # the paginated endpoint filters on the server (matching substrings, so the
+        # exact name is still checked); older servers only list all the versions
+        try:
+            versions = self._iter_pages(
+                Version,
+                "values",
+                "project/%s/version" % project,
+                maxResults=False,
+                params={"query": version_name},
+            )
+        except JIRAError as e:
+            if e.status_code != 404:
+                raise
+            for raw_ver_json in self._get_json("project/%s/versions" % project):
+                if raw_ver_json["name"] == version_name:
+                    return Version(self._options, self._session, raw_ver_json)
+            return None
         for version in versions:
             if version.name == version_name:
                 return version
@@ -2415,16 +3241,11 @@ class JIRA(object):
 
         :param project: ID or key of the project to get roles from
         """
-        path = "project/" + project + "/role"
+        path = "project/%s/role" % project
         _rolesdict = self._get_json(path)
-        rolesdict = {}
-
-        for k, v in _rolesdict.items():
-            tmp = {}
-            tmp["id"] = v.split("/")[-1]
-            tmp["url"] = v
-            rolesdict[k] = tmp
-        return rolesdict
+        return {
+            k: {"id": v.rsplit("/", 1)[-1], "url": v} for k, v in _rolesdict.items()
+        }
         # TODO(ssbarnea): return a list of Roles()
 
     @translate_resource_args
@@ -2446,12 +3267,13 @@ class JIRA(object):
         :rtype: List[Resolution]
 
         """
-        r_json = self._get_json("resolution")
-        resolutions = [
-            Resolution(self._options, self._session, raw_res_json)
-            for raw_res_json in r_json
-        ]
-        return resolutions
+        resolutions = self._get_metadata(
+            "resolution",
+            lambda: Resolution.from_raw_batch(
+                self._options, self._session, self._get_json_revalidated("resolution")
+            ),
+        )
+        return list(resolutions)
 
     def resolution(self, id):
         """Get a resolution Resource from the server.
@@ -2460,7 +3282,7 @@ class JIRA(object):
         :type id: str
         :rtype: Resolution
         """
-        return self._find_for_resource(Resolution, id)
+        return self._find_metadata(Resolution, id, "resolution", self.resolutions)
 
     # Search
 
@@ -2497,6 +3319,65 @@ class JIRA(object):
 
         :rtype: dict or :class:`~jira.client.ResultList`
 
+        """
+        search_params, aliases = self._search_params(
+            jql_str, startAt, validate_query, fields, expand
+        )
+        if json_result:
+            search_params["maxResults"] = maxResults
+            if not maxResults:
+                warnings.warn(
+                    "All issues cannot be fetched at once, when json_result parameter is set",
+                    Warning,
+                )
+            return self._get_json("search", params=search_params)
+
+        issues = self._fetch_pages(
+            Issue, "issues", "search", startAt, maxResults, search_params
+        )
+
+        if aliases:
+            for i in issues:
+                self._add_field_aliases(i, aliases)
+
+        return issues
+
+    def iter_search_issues(
+        self, jql_str, startAt=0, validate_query=True, fields=None, expand=None
+    ):
+        """Iterate over all the issue Resources matching a JQL search string.
+
+        Unlike :py:meth:`search_issues` with a falsy ``maxResults``, the issues are not
+        collected in a list: each page is requested while the issues of the previous
+        one are consumed, so only a couple of pages are held in memory at a time.
+
+        :param jql_str: The JQL search string.
+        :type jql_str: str
+        :param startAt: Index of the first issue to return. (Default: 0)
+        :type startAt: int
+        :param validate_query: Whether or not the query should be validated. (Default: True)
+        :type validate_query: bool
+        :param fields: comma-separated string or list of issue fields to include in the results.
+            Default is to include all fields.
+        :type fields: Optional[str or list]
+        :param expand: extra information to fetch inside each resource
+        :type expand: Optional[str]
+
+        :rtype: Iterator[Issue]
+        """
+        search_params, aliases = self._search_params(
+            jql_str, startAt, validate_query, fields, expand
+        )
+        issues = self._iter_pages(Issue, "issues", "search", startAt, 0, search_params)
+        for issue in issues:
+            if aliases:
+                self._add_field_aliases(issue, aliases)
+            yield issue
+
+    def _search_params(self, jql_str, startAt, validate_query, fields, expand):
+        """Return the params of a search, and the aliases of the fields requested.
+
+        :rtype: Tuple[Dict[str, Any], List[Tuple[str, str]]]
         """
         if isinstance(fields, str):
             fields = fields.split(",")
@@ -2507,10 +3388,8 @@ class JIRA(object):
         # most people do know the JQL names so this will help them use the API easier
         untranslate = {}  # use to add friendly aliases when we get the results back
         if self._fields:
-            for i, field in enumerate(fields):
-                if field in self._fields:
-                    untranslate[self._fields[field]] = fields[i]
-                    fields[i] = self._fields[field]
+            untranslate = {self._fields[f]: f for f in fields if f in self._fields}
+            fields = [self._fields.get(f, f) for f in fields]
 
         search_params = {
             "jql": jql_str,
@@ -2519,26 +3398,16 @@ class JIRA(object):
             "fields": fields,
             "expand": expand,
         }
-        if json_result:
-            search_params["maxResults"] = maxResults
-            if not maxResults:
-                warnings.warn(
-                    "All issues cannot be fetched at once, when json_result parameter is set",
-                    Warning,
-                )
-            return self._get_json("search", params=search_params)
-
-        issues = self._fetch_pages(
-            Issue, "issues", "search", startAt, maxResults, search_params
-        )
-
-        if untranslate:
-            for i in issues:
-                for k, v in untranslate.items():
-                    if k in i.raw.get("fields", {}):
-                        i.raw["fields"][v] = i.raw["fields"][k]
+        return search_params, list(untranslate.items())
 
-        return issues
+    @staticmethod
+    def _add_field_aliases(issue, aliases):
+        issue_fields = issue.raw.get("fields")
+        if not issue_fields:
+            return
+        for k, v in aliases:
+            if k in issue_fields:
+                issue_fields[v] = issue_fields[k]
 
     # Security levels
     def security_level(self, id):
@@ -2555,14 +3424,22 @@ class JIRA(object):
         """Get a dict of server information for this Jira instance.
         :rtype: Dict[str, Any]
         """
-        retry = 0
+        # server information is the same for all users
+        cache = self._get_server_cache(per_user=False)
+        if cache is not None and "serverInfo" in cache:
+            return cache["serverInfo"]
         j = self._get_json("serverInfo")
-        while not j and retry < 3:
+        # back off between the attempts instead of hitting the server right away
+        for delay in (0.05, 0.1, 0.2):
+            if j:
+                break
             logging.warning(
                 "Bug https://jira.atlassian.com/browse/JRA-59676 trying again..."
             )
-            retry += 1
+            time.sleep(delay)
             j = self._get_json("serverInfo")
+        if cache is not None and j:
+            cache["serverInfo"] = j
         return j
 
     def myself(self):
@@ -2577,12 +3454,13 @@ class JIRA(object):
         :rtype: List[Status]
 
         """
-        r_json = self._get_json("status")
-        statuses = [
-            Status(self._options, self._session, raw_stat_json)
-            for raw_stat_json in r_json
-        ]
-        return statuses
+        statuses = self._get_metadata(
+            "status",
+            lambda: Status.from_raw_batch(
+                self._options, self._session, self._get_json_revalidated("status")
+            ),
+        )
+        return list(statuses)
 
     def status(self, id):
         # type: (str) -> Status
@@ -2590,7 +3468,7 @@ class JIRA(object):
 
         :param id: ID of the status resource to get
         """
-        return self._find_for_resource(Status, id)
+        return self._find_metadata(Status, id, "status", self.statuses)
 
     # Category
 
@@ -2599,12 +3477,15 @@ class JIRA(object):
 
         :rtype: List[StatusCategory]
         """
-        r_json = self._get_json("statuscategory")
-        statuscategories = [
-            StatusCategory(self._options, self._session, raw_stat_json)
-            for raw_stat_json in r_json
-        ]
-        return statuscategories
+        categories = self._get_metadata(
+            "statuscategory",
+            lambda: StatusCategory.from_raw_batch(
+                self._options,
+                self._session,
+                self._get_json_revalidated("statuscategory"),
+            ),
+        )
+        return list(categories)
 
     def statuscategory(self, id):
         """Get a status category Resource from the server.
@@ -2615,7 +3496,9 @@ class JIRA(object):
         :rtype: StatusCategory
 
         """
-        return self._find_for_resource(StatusCategory, id)
+        return self._find_metadata(
+            StatusCategory, id, "statuscategory", self.statuscategories
+        )
 
     # Users
 
@@ -2750,12 +3633,11 @@ class JIRA(object):
 
         :rtype: NoReturn
         """
-        size_from_file = os.path.getsize(filename)
-        if size != size_from_file:
-            size = size_from_file
+        # the size given is ignored, the actual size of the file is sent
+        size = _get_file_size(filename, avatar_img)
 
         # remove path from filename
-        filename = os.path.split(filename)[1]
+        filename = os.path.basename(filename)
 
         params = {"username": user, "filename": filename, "size": size}
 
@@ -2775,6 +3657,36 @@ class JIRA(object):
         else:
             return cropping_properties
 
+    def create_temp_user_avatars(self, avatars, contentType=None, auto_confirm=False):
+        """Register several image files as user avatars.
+
+        Each file is read once and uploaded with :py:meth:`create_temp_user_avatar`.
+        The uploads are sent concurrently when the ``async`` option is set, reusing
+        the connections kept open by the session.
+
+        :param avatars: pairs of the user to register the avatar for and the path of
+            the avatar file
+        :type avatars: Iterable[Tuple[str, str]]
+        :param contentType: explicit specification for the content-type of the images
+        :type contentType: Optional[str]
+        :param auto_confirm: whether to automatically confirm the temporary avatars
+            with :py:meth:`confirm_user_avatar`. (Default: False)
+        :type auto_confirm: bool
+        :return: the values returned by :py:meth:`create_temp_user_avatar`, in the
+            order of ``avatars``
+        :rtype: List[Dict[str, Any]]
+        """
+
+        def upload(avatar):
+            user, filename = avatar
+            with open(filename, "rb") as f:
+                data = f.read()
+            return self.create_temp_user_avatar(
+                user, filename, len(data), data, contentType, auto_confirm
+            )
+
+        return self._map(upload, avatars)
+
     def confirm_user_avatar(self, user, cropping_properties):
         """Confirm the temporary avatar image previously uploaded with the specified cropping.
 
@@ -2790,7 +3702,7 @@ class JIRA(object):
         """
         data = cropping_properties
         url = self._get_url("user/avatar")
-        r = self._session.post(url, params={"username": user}, data=json.dumps(data))
+        r = self._session.post(url, params={"username": user}, data=json_dumps(data))
 
         return json_loads(r)
 
@@ -2809,7 +3721,7 @@ class JIRA(object):
         :param avatar: ID of the avatar to remove
         """
         params = {"username": username}
-        url = self._get_url("user/avatar/" + avatar)
+        url = self._get_url("user/avatar/%s" % avatar)
         return self._session.delete(url, params=params)
 
     def search_users(
@@ -2905,9 +3817,8 @@ class JIRA(object):
             data["startDate"] = startDate
 
         url = self._get_url("version")
-        r = self._session.post(url, data=json.dumps(data))
+        r = self._session.post(url, data=json_dumps(data))
 
-        time.sleep(1)
         version = Version(self._options, self._session, raw=json_loads(r))
         return version
 
@@ -2921,14 +3832,17 @@ class JIRA(object):
         :param position: the absolute position to move this version to: must be one of ``First``, ``Last``,
             ``Earlier``, or ``Later``
         """
-        data = {}
         if after is not None:
-            data["after"] = after
+            body = json_dumps({"after": after})
+        elif position in _VERSION_POSITIONS:
+            body = _VERSION_POSITIONS[position]
         elif position is not None:
-            data["position"] = position
+            body = json_dumps({"position": position})
+        else:
+            body = json_dumps({})
 
-        url = self._get_url("version/" + id + "/move")
-        r = self._session.post(url, data=json.dumps(data))
+        url = self._get_url("version/%s/move" % id)
+        r = self._session.post(url, data=body)
 
         version = Version(self._options, self._session, raw=json_loads(r))
         return version
@@ -2955,7 +3869,7 @@ class JIRA(object):
 
         :param id: the version to count issues for
         """
-        r_json = self._get_json("version/" + id + "/relatedIssueCounts")
+        r_json = self._get_json("version/%s/relatedIssueCounts" % id)
         del r_json["self"]  # this isn't really an addressable resource
         return r_json
 
@@ -2964,7 +3878,7 @@ class JIRA(object):
 
         :param id: ID of the version to count issues for
         """
-        return self._get_json("version/" + id + "/unresolvedIssueCount")[
+        return self._get_json("version/%s/unresolvedIssueCount" % id)[
             "issuesUnresolvedCount"
         ]
 
@@ -3062,33 +3976,35 @@ class JIRA(object):
 
     @staticmethod
     def _timestamp(dt=None):
-        t = datetime.datetime.utcnow()
+        t = int(time.time())
         if dt is not None:
-            t += dt
-        return calendar.timegm(t.timetuple())
+            t += int(dt.total_seconds())
+        return t
 
     def _create_jwt_session(self, jwt, timeout):
         try:
-            jwt_auth = JWTAuth(jwt["secret"], alg="HS256")
-        except NameError as e:
+            from requests_jwt import JWTAuth
+        except ImportError as e:
             logging.error("JWT authentication requires requests_jwt")
             raise e
+
+        jwt_auth = JWTAuth(jwt["secret"], alg="HS256")
         jwt_auth.set_header_format("JWT %s")
 
-        jwt_auth.add_field("iat", lambda req: JIRA._timestamp())
-        jwt_auth.add_field(
-            "exp", lambda req: JIRA._timestamp(datetime.timedelta(minutes=3))
-        )
+        # the tokens are valid for 3 minutes; the fields are computed for every
+        # request, time.time is bound to skip its lookup
+        jwt_auth.add_field("iat", lambda req, _now=time.time: int(_now()))
+        jwt_auth.add_field("exp", lambda req, _now=time.time: int(_now()) + 180)
         jwt_auth.add_field("qsh", QshGenerator(self._options["context_path"]))
-        for f in jwt["payload"].items():
-            jwt_auth.add_field(f[0], f[1])
+        for name, value in jwt["payload"].items():
+            jwt_auth.add_field(name, value)
         self._session = ResilientSession(timeout=timeout)
         self._session.verify = self._options["verify"]
         self._session.auth = jwt_auth
 
     def _set_avatar(self, params, url, avatar):
         data = {"id": avatar}
-        return self._session.put(url, params=params, data=json.dumps(data))
+        return self._session.put(url, params=params, data=json_dumps(data))
 
     def _get_url(self, path, base=JIRA_BASE_URL):
         """ Returns the full url based on Jira base url and the path provided
@@ -3102,9 +4018,17 @@ class JIRA(object):
         :rtype: str
 
         """
-        options = self._options.copy()
-        options.update({"path": path})
-        return base.format(**options)
+        options = self._options
+        fields = _url_fields(base)
+        if fields is None:
+            return base.format(**{**options, "path": path})
+        # the prefix only changes if the options it is made of are modified
+        key = tuple(options[name] for name in fields)
+        url_prefix = self._url_prefixes.get(base)
+        if url_prefix is None or url_prefix[0] != key:
+            url_prefix = (key, base.format(**{**options, "path": ""}))
+            self._url_prefixes[base] = url_prefix
+        return url_prefix[1] + path
 
     def _get_json(self, path, params=None, base=JIRA_BASE_URL):
         """Get the json for a given path and params.
@@ -3124,10 +4048,78 @@ class JIRA(object):
         try:
             r_json = json_loads(r)
         except ValueError as e:
-            logging.error("%s\n%s" % (e, r.text))
+            logging.error("%s\n%s", e, r.text)
             raise e
         return r_json
 
+    def _iter_json_array(self, path, array_key=None, params=None):
+        """Iterate over the items of the json array returned for a given path.
+
+        With ijson installed, the items are parsed while the response is read, so the
+        whole response is never held in memory at once.
+
+        :param path: The subpath required
+        :type path: str
+        :param array_key: The key of the array in the json object returned, if any.
+        :type array_key: Optional[str]
+        :param params: Parameters to filter the json query.
+        :type params: Optional[Dict[str, Any]]
+        :rtype: Iterator[Dict[str, Any]]
+        """
+        ijson = _get_ijson()
+        if ijson is None:
+            r_json = self._get_json(path, params=params)
+            yield from r_json if array_key is None else r_json[array_key]
+            return
+        r = self._session.get(self._get_url(path), params=params, stream=True)
+        # the raw stream is not decompressed by default
+        r.raw.decode_content = True
+        prefix = "item" if array_key is None else array_key + ".item"
+        try:
+            yield from ijson.items(r.raw, prefix, use_float=True)
+        finally:
+            r.close()
+
+    def _get_json_revalidated(self, path, params=None, base=JIRA_BASE_URL):
+        """Get the json for a given path and params, revalidating the last response.
+
+        When the last response for the same path and params had an ETag, it is sent
+        back in ``If-None-Match``, and the server can answer that it did not change
+        without sending it again. Only read-mostly data should be fetched this way.
+
+        :param path: The subpath required
+        :type path: str
+        :param params: Parameters to filter the json query.
+        :type params: Optional[Dict[str, Any]]
+        :param base: The Base Jira URL, defaults to the instance base.
+        :type base: Optional[str]
+        :rtype: Union[Dict[str, Any], List[Dict[str, str]]]
+        """
+        url = self._get_url(path, base)
+        key = (url, tuple(sorted(params.items())) if params else ())
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached is not None else {}
+        r = self._session.get(url, params=params, headers=headers)
+        if r.status_code == 304 and cached is not None:
+            # the parsed json is not kept, callers can modify what they get
+            r = cached[1]
+        else:
+            etag = r.headers.get("ETag")
+            with self._etag_lock:
+                if etag:
+                    self._etag_cache[key] = (etag, r)
+                    self._etag_cache.move_to_end(key)
+                    if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                        self._etag_cache.popitem(last=False)
+                else:
+                    self._etag_cache.pop(key, None)
+        try:
+            return json_loads(r)
+        except ValueError as e:
+            logging.error("%s\n%s", e, r.text)
+            raise e
+
     def _find_for_resource(self, resource_cls, ids, expand=None):
         resource = resource_cls(self._options, self._session)
         params = {}
@@ -3141,17 +4133,13 @@ class JIRA(object):
     def _try_magic(self):
         try:
             import magic
-            import weakref
         except ImportError:
             self._magic = None
         else:
             try:
                 _magic = magic.Magic(flags=magic.MAGIC_MIME_TYPE)
-
-                def cleanup(x):
-                    _magic.close()
-
-                self._magic_weakref = weakref.ref(self, cleanup)
+                # closed when the client is garbage collected, or at exit
+                self._magic_finalizer = weakref.finalize(self, _magic.close)
                 self._magic = _magic
             except TypeError:
                 self._magic = None
@@ -3161,18 +4149,49 @@ class JIRA(object):
     def _get_mime_type(self, buff):
         """Get the MIME type for a given stream of bytes
 
+        The types detected by ``libmagic`` are kept for the last images seen, keyed
+        on their size and first bytes, so that uploading the same image again does
+        not go through it again.
+
         :param buff: Stream of bytes
         :type buff: bytes
 
         :rtype: str
 
         """
+        if not isinstance(buff, bytes):
+            return self._detect_mime_type(buff)
+        mime_type = _image_prefix_type(buff)
+        if mime_type is not None:
+            return mime_type
+        key = (len(buff), buff[:_MIME_KEY_SIZE])
+        with self._ids_lock:
+            if key in self._mime_types:
+                self._mime_types.move_to_end(key)
+                return self._mime_types[key]
+        mime_type = self._detect_mime_type(buff)
+        if mime_type is not None:
+            with self._ids_lock:
+                self._mime_types[key] = mime_type
+                if len(self._mime_types) > _MIME_TYPES_SIZE:
+                    self._mime_types.popitem(last=False)
+        return mime_type
+
+    def _detect_mime_type(self, buff):
+        if isinstance(buff, bytes):
+            mime_type = _image_prefix_type(buff)
+            if mime_type is not None:
+                return mime_type
         if self._magic is not None:
             return self._magic.id_buffer(buff)
         else:
             try:
+                # imghdr is deprecated and gone from recent Python versions
+                import imghdr
+                import mimetypes
+
                 return mimetypes.guess_type("f." + imghdr.what(0, buff))[0]
-            except (IOError, TypeError):
+            except (ImportError, IOError, TypeError):
                 logging.warning(
                     "Couldn't detect content type of avatar image"
                     ". Specify the 'contentType' parameter explicitly."
@@ -3189,14 +4208,15 @@ class JIRA(object):
 
         """
         if self._version > (6, 0, 0):
-            url = self._options["server"] + "/rest/api/latest/user"
+            url = self._rest_api_url + "/user"
             payload = {"name": new_user}
             params = {"username": old_user}
 
-            # raw displayName
-            logging.debug("renaming %s" % self.user(old_user).emailAddress)
+            # raw displayName, only looked up when it is logged
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("renaming %s", self.user(old_user).emailAddress)
 
-            r = self._session.put(url, params=params, data=json.dumps(payload))
+            r = self._session.put(url, params=params, data=json_dumps(payload))
             raise_on_error(r)
         else:
             raise NotImplementedError(
@@ -3214,7 +4234,7 @@ class JIRA(object):
 
         """
 
-        url = self._options["server"] + "/rest/api/latest/user/?username=%s" % username
+        url = self._rest_api_url + "/user/?username=%s" % username
 
         r = self._session.delete(url)
         if 200 <= r.status_code <= 299:
@@ -3241,17 +4261,19 @@ class JIRA(object):
                     user.raw["session"]["name"],
                     user.raw["session"]["value"],
                 )
-            url = self._options[
-                "server"
-            ] + "/admin/rest/um/1/user/deactivate?username=%s" % (username)
-            # We can't use our existing session here - this endpoint is fragile and objects to extra headers
+            url = self._options["server"] + "/admin/rest/um/1/user/deactivate"
+            # We can't use our existing session here - this endpoint is fragile and objects to extra headers.
+            # A separate one is kept instead, so that its connection is reused.
+            if self._deactivate_session is None:
+                session = requests.Session()
+                session.headers.update(
+                    {"Cookie": self.authCookie, "Content-Type": "application/json"}
+                )
+                self._deactivate_session = session
             try:
-                r = requests.post(
+                r = self._deactivate_session.post(
                     url,
-                    headers={
-                        "Cookie": self.authCookie,
-                        "Content-Type": "application/json",
-                    },
+                    params={"username": username},
                     proxies=self._session.proxies,
                     data={},
                 )
@@ -3259,12 +4281,13 @@ class JIRA(object):
                     return True
                 else:
                     logging.warning(
-                        "Got response from deactivating %s: %s"
-                        % (username, r.status_code)
+                        "Got response from deactivating %s: %s",
+                        username,
+                        r.status_code,
                     )
                     return r.status_code
             except Exception as e:
-                logging.error("Error Deactivating %s: %s" % (username, e))
+                logging.error("Error Deactivating %s: %s", username, e)
                 raise JIRAError("Error Deactivating %s: %s" % (username, e))
         else:
             url = self._options["server"] + "/secure/admin/user/EditUser.jspa"
@@ -3288,12 +4311,13 @@ class JIRA(object):
                     return True
                 else:
                     logging.warning(
-                        "Got response from deactivating %s: %s"
-                        % (username, r.status_code)
+                        "Got response from deactivating %s: %s",
+                        username,
+                        r.status_code,
                     )
                     return r.status_code
             except Exception as e:
-                logging.error("Error Deactivating %s: %s" % (username, e))
+                logging.error("Error Deactivating %s: %s", username, e)
                 raise JIRAError("Error Deactivating %s: %s" % (username, e))
 
     def reindex(self, force=False, background=True):
@@ -3318,23 +4342,22 @@ class JIRA(object):
             # logging.warning("Jira returned 503, this could mean that a full reindex is in progress.")
             return 503
 
-        if (
-            not r.text.find("To perform the re-index now, please go to the")
-            and force is False
-        ):
+        body = r.content
+        needed = _REINDEX_NEEDED in body
+        if not needed and force is False:
             return True
 
-        if r.text.find("All issues are being re-indexed"):
+        if _REINDEX_RUNNING in body:
             logging.warning("Jira re-indexing is already running.")
             return True  # still reindexing is considered still a success
 
-        if r.text.find("To perform the re-index now, please go to the") or force:
+        if needed or force:
             r = self._session.post(
                 url,
                 headers=self._options["headers"],
                 params={"indexingStrategy": indexingStrategy, "reindex": "Re-Index"},
             )
-            if r.text.find("All issues are being re-indexed") != -1:
+            if _REINDEX_RUNNING in r.content:
                 return True
             else:
                 logging.error("Failed to reindex jira, probably a bug.")
@@ -3344,7 +4367,7 @@ class JIRA(object):
         """Will call jira export to backup as zipped xml. Returning with success does not mean that the backup process finished."""
         if self.deploymentType == "Cloud":
             url = self._options["server"] + "/rest/backup/1/export/runbackup"
-            payload = json.dumps({"cbAttachments": attachments})
+            payload = _BACKUP_PAYLOADS[bool(attachments)]
             self._options["headers"]["X-Requested-With"] = "XMLHttpRequest"
         else:
             url = self._options["server"] + "/secure/admin/XmlBackup.jspa"
@@ -3354,7 +4377,7 @@ class JIRA(object):
             if r.status_code == 200:
                 return True
             else:
-                logging.warning("Got %s response from calling backup." % r.status_code)
+                logging.warning("Got %s response from calling backup.", r.status_code)
                 return r.status_code
         except Exception as e:
             logging.error("I see %s", e)
@@ -3377,15 +4400,14 @@ class JIRA(object):
         try:
             return json.loads(r.text)
         except Exception:
-            import defusedxml.ElementTree as etree
-
             progress = {}
             try:
-                root = etree.fromstring(r.text)
-            except etree.ParseError as pe:
+                # the bytes are parsed as they are, the XML declares its encoding
+                root = defused_etree.fromstring(r.content)
+            except defused_etree.ParseError as pe:
                 logging.warning(
-                    "Unable to find backup info.  You probably need to initiate a new backup. %s"
-                    % pe
+                    "Unable to find backup info.  You probably need to initiate a new backup. %s",
+                    pe,
                 )
                 return None
             for k in root.keys():
@@ -3399,7 +4421,7 @@ class JIRA(object):
             return None
         status = self.backup_progress()
         perc_complete = int(
-            re.search(r"\s([0-9]*)\s", status["alternativePercentage"]).group(1)
+            _BACKUP_PERCENTAGE_RE.search(status["alternativePercentage"]).group(1)
         )
         file_size = int(status["size"])
         return perc_complete >= 100 and file_size > 0
@@ -3413,7 +4435,7 @@ class JIRA(object):
         local_file = filename or remote_file
         url = self._options["server"] + "/webdav/backupmanager/" + remote_file
         try:
-            logging.debug("Writing file to %s" % local_file)
+            logging.debug("Writing file to %s", local_file)
             with open(local_file, "wb") as file:
                 try:
                     resp = self._session.get(
@@ -3422,12 +4444,13 @@ class JIRA(object):
                 except Exception:
                     raise JIRAError()
                 if not resp.ok:
-                    logging.error("Something went wrong with download: %s" % resp.text)
+                    logging.error("Something went wrong with download: %s", resp.text)
                     raise JIRAError(resp.text)
-                for block in resp.iter_content(1024):
+                # backups are large, 1 KiB chunks meant millions of writes
+                for block in resp.iter_content(1024 * 1024):
                     file.write(block)
         except JIRAError as je:
-            logging.error("Unable to access remote backup file: %s" % je)
+            logging.error("Unable to access remote backup file: %s", je)
         except IOError as ioe:
             logging.error(ioe)
         return None
@@ -3438,13 +4461,10 @@ class JIRA(object):
 
         :rtype: str
         """
-        if not hasattr(self, "_myself"):
-
+        if self._myself is None:
             url = self._get_url("myself")
             r = self._session.get(url, headers=self._options["headers"])
-
-            r_json = json_loads(r)
-            self._myself = r_json
+            self._myself = json_loads(r)
 
         return self._myself[field]
 
@@ -3464,6 +4484,7 @@ class JIRA(object):
 
         url = self._options["server"] + "/rest/api/2/project/%s" % pid
         r = self._session.delete(url)
+        self._metadata_cache.pop("project", None)
         if r.status_code == 403:
             raise JIRAError("Not enough permissions to delete project")
         if r.status_code == 404:
@@ -3511,98 +4532,74 @@ class JIRA(object):
     @lru_cache(maxsize=None)
     def permissionschemes(self):
 
-        url = self._options["server"] + "/rest/api/3/permissionscheme"
-
-        r = self._session.get(url)
-        data = json_loads(r)["permissionSchemes"]
+        data = self._get_json("permissionscheme", base=_API_3_BASE_URL)
 
-        return data
+        return data["permissionSchemes"]
 
     @lru_cache(maxsize=None)
     def issuesecurityschemes(self):
 
-        url = self._options["server"] + "/rest/api/3/issuesecurityschemes"
-
-        r = self._session.get(url)
-        data = json_loads(r)["issueSecuritySchemes"]
+        data = self._get_json("issuesecurityschemes", base=_API_3_BASE_URL)
 
-        return data
+        return data["issueSecuritySchemes"]
 
     @lru_cache(maxsize=None)
     def projectcategories(self):
 
-        url = self._options["server"] + "/rest/api/3/projectCategory"
-
-        r = self._session.get(url)
-        data = json_loads(r)
+        data = self._get_json("projectCategory", base=_API_3_BASE_URL)
 
         return data
 
-    @lru_cache(maxsize=None)
+    @lru_cache(maxsize=8)
     def avatars(self, entity="project"):
 
-        url = self._options["server"] + "/rest/api/3/avatar/%s/system" % entity
-
-        r = self._session.get(url)
-        data = json_loads(r)["system"]
+        data = self._get_json("avatar/%s/system" % entity, base=_API_3_BASE_URL)
 
-        return data
+        return data["system"]
 
     @lru_cache(maxsize=None)
     def notificationschemes(self):
         # TODO(ssbarnea): implement pagination support
-        url = self._options["server"] + "/rest/api/3/notificationscheme"
-
-        r = self._session.get(url)
-        data = json_loads(r)
+        data = self._get_json("notificationscheme", base=_API_3_BASE_URL)
         return data["values"]
 
     @lru_cache(maxsize=None)
     def screens(self):
         # TODO(ssbarnea): implement pagination support
-        url = self._options["server"] + "/rest/api/3/screens"
-
-        r = self._session.get(url)
-        data = json_loads(r)
+        data = self._get_json("screens", base=_API_3_BASE_URL)
         return data["values"]
 
     @lru_cache(maxsize=None)
     def workflowscheme(self):
         # TODO(ssbarnea): implement pagination support
-        url = self._options["server"] + "/rest/api/3/workflowschemes"
-
-        r = self._session.get(url)
-        data = json_loads(r)
+        data = self._get_json("workflowschemes", base=_API_3_BASE_URL)
         return data  # ['values']
 
     @lru_cache(maxsize=None)
     def workflows(self):
         # TODO(ssbarnea): implement pagination support
-        url = self._options["server"] + "/rest/api/3/workflow"
-
-        r = self._session.get(url)
-        data = json_loads(r)
+        data = self._get_json("workflow", base=_API_3_BASE_URL)
         return data  # ['values']
 
     def delete_screen(self, id):
 
         url = self._options["server"] + "/rest/api/3/screens/%s" % id
 
+        # the server answers 204 No Content, errors are raised by the session
         r = self._session.delete(url)
-        data = json_loads(r)
 
         self.screens.cache_clear()
-        return data
+        return r.ok
 
     def delete_permissionscheme(self, id):
 
         url = self._options["server"] + "/rest/api/3/permissionscheme/%s" % id
 
+        # the server answers 204 No Content, errors are raised by the session
         r = self._session.delete(url)
-        data = json_loads(r)
 
         self.permissionschemes.cache_clear()
-        return data
+        return r.ok
 
     def create_project(
         self,
@@ -3639,37 +4636,35 @@ class JIRA(object):
         """
         template_key = None
 
+        # the lookups needed are independent, so they are sent together when the
+        # async option is set; their results are cached for the calls below
+        lookups = [
+            lookup
+            for lookup, needed in (
+                (partial(self.current_user, "accountId"), assignee is None),
+                (self.permissionschemes, not permissionScheme),
+                (self.issuesecurityschemes, not issueSecurityScheme),
+                (self.projectcategories, not projectCategory),
+            )
+            if needed
+        ]
+        if len(lookups) > 1:
+            self._map(lambda lookup: lookup(), lookups)
+
         if assignee is None:
             assignee = self.current_user("accountId")
         if name is None:
             name = key
 
         if not permissionScheme:
-            ps_list = self.permissionschemes()
-            for sec in ps_list:
-                if sec["name"] == "Default Permission Scheme":
-                    permissionScheme = sec["id"]
-                break
-            if not permissionScheme:
-                permissionScheme = ps_list[0]["id"]
-
+            permissionScheme = self._find_default(
+                self.permissionschemes(), "Default Permission Scheme"
+            )
         if not issueSecurityScheme:
-            ps_list = self.issuesecurityschemes()
-            for sec in ps_list:
-                if sec["name"] == "Default":  # no idea which one is default
-                    issueSecurityScheme = sec["id"]
-                break
-            if not issueSecurityScheme and ps_list:
-                issueSecurityScheme = ps_list[0]["id"]
-
+            # no idea which one is default
+            issueSecurityScheme = self._find_default(self.issuesecurityschemes())
         if not projectCategory:
-            ps_list = self.projectcategories()
-            for sec in ps_list:
-                if sec["name"] == "Default":  # no idea which one is default
-                    projectCategory = sec["id"]
-                break
-            if not projectCategory and ps_list:
-                projectCategory = ps_list[0]["id"]
+            projectCategory = self._find_default(self.projectcategories())
         # <beep> Atlassian for failing to provide an API to get projectTemplateKey values
         #  Possible values are just hardcoded and obviously depending on Jira version.
         # https://developer.atlassian.com/cloud/jira/platform/rest/v3/?_ga=2.88310429.766596084.1562439833-992274574.1559129176#api-rest-api-3-project-post
@@ -3752,11 +4747,25 @@ class JIRA(object):
 
         url = self._options["server"] + "/rest/api/3/project"
 
-        r = self._session.post(url, data=json.dumps(payload))
+        r = self._session.post(url, data=json_dumps(payload))
         r.raise_for_status()
+        self._metadata_cache.pop("project", None)
         r_json = json_loads(r)
         return r_json
 
+    @staticmethod
+    def _find_default(items, name="Default"):
+        """Return the id of the item with the given name, or of the first item.
+
+        :type items: List[Dict[str, Any]]
+        :type name: str
+        :rtype: Optional[Any]
+        """
+        for item in items:
+            if item.get("name") == name:
+                return item["id"]
+        return items[0]["id"] if items else None
+
     def add_user(
         self,
         username,
@@ -3800,15 +4809,11 @@ class JIRA(object):
             fullname = username
         # TODO(ssbarnea): default the directoryID to the first directory in jira instead
         # of 1 which is the internal one.
-        url = self._options["server"] + "/rest/api/latest/user"
+        url = self._rest_api_url + "/user"
 
         # implementation based on
         # https://docs.atlassian.com/jira/REST/ondemand/#d2e5173
-        x = OrderedDict()
-
-        x["displayName"] = fullname
-        x["emailAddress"] = email
-        x["name"] = username
+        x = {"displayName": fullname, "emailAddress": email, "name": username}
         if password:
             x["password"] = password
         if notify:
@@ -3816,7 +4821,7 @@ class JIRA(object):
         if application_keys is not None:
             x["applicationKeys"] = application_keys
 
-        payload = json.dumps(x)
+        payload = json_dumps(x)
         try:
             self._session.post(url, data=payload)
         except JIRAError as e:
@@ -3841,11 +4846,11 @@ class JIRA(object):
         :return: json response from Jira server for success or a value that evaluates as False in case of failure.
         :rtype: Union[bool,Dict[str,Any]]
         """
-        url = self._options["server"] + "/rest/api/latest/group/user"
+        url = self._rest_api_url + "/group/user"
         x = {"groupname": group}
         y = {"name": username}
 
-        payload = json.dumps(y)
+        payload = json_dumps(y)
 
         r = json_loads(self._session.post(url, params=x, data=payload))
         if "name" not in r or r["name"] != group:
@@ -3859,7 +4864,7 @@ class JIRA(object):
         :param username: The user to remove from the group.
         :param groupname: The group that the user will be removed from.
         """
-        url = self._options["server"] + "/rest/api/latest/group/user"
+        url = self._rest_api_url + "/group/user"
         x = {"groupname": groupname, "username": username}
 
         self._session.delete(url, params=x)
@@ -3875,7 +4880,7 @@ class JIRA(object):
         """
         # https://developer.atlassian.com/cloud/jira/platform/rest/v3/?utm_source=%2Fcloud%2Fjira%2Fplatform%2Frest%2F&utm_medium=302#api-rest-api-3-role-get
 
-        url = self._options["server"] + "/rest/api/latest/role"
+        url = self._rest_api_url + "/role"
 
         r = self._session.get(url)
         return json_loads(r)
@@ -3959,6 +4964,7 @@ class JIRA(object):
         :param board_id: the board to get sprints from
         :param extended: Used only by old GreenHopper API to fetch additional information like
             startDate, endDate, completeDate, much slower because it requires an additional requests for each sprint.
+            Those requests are sent concurrently when the ``async`` option is set.
             New Jira Agile API always returns this information without a need for additional requests.
         :param startAt: the index of the first sprint to return (0 based)
         :param maxResults: the maximum number of sprints to return
@@ -3984,9 +4990,12 @@ class JIRA(object):
             self._options["agile_rest_path"]
             == GreenHopperResource.GREENHOPPER_REST_PATH
         ):
-            r_json = self._get_json(
-                "sprintquery/%s?includeHistoricSprints=true&includeFutureSprints=true"
-                % board_id,
+            r_json = self._get_json_revalidated(
+                "sprintquery/%s" % board_id,
+                params={
+                    "includeHistoricSprints": "true",
+                    "includeFutureSprints": "true",
+                },
                 base=self.AGILE_BASE_URL,
             )
 
@@ -3997,20 +5006,32 @@ class JIRA(object):
                     Warning,
                 )
 
-            if extended:
-                sprints = [
-                    Sprint(
-                        self._options,
-                        self._session,
-                        self.sprint_info(None, raw_sprints_json["id"]),
+            if extended and self._use_aiohttp():
+                urls = [
+                    self._get_url(
+                        "sprint/%s/edit/model" % raw_sprints_json["id"],
+                        base=self.AGILE_BASE_URL,
                     )
                     for raw_sprints_json in r_json["sprints"]
                 ]
+                results = self._get_many_aiohttp([(url, ()) for url in urls])
+                sprints = Sprint.from_raw_batch(
+                    self._options, self._session, [j["sprint"] for j in results]
+                )
+            elif extended:
+                # one request per sprint, sent concurrently with the async option
+                sprints = self._map(
+                    lambda raw_sprints_json: Sprint(
+                        self._options,
+                        self._session,
+                        self.sprint_info(None, raw_sprints_json["id"]),
+                    ),
+                    r_json["sprints"],
+                )
             else:
-                sprints = [
-                    Sprint(self._options, self._session, raw_sprints_json)
-                    for raw_sprints_json in r_json["sprints"]
-                ]
+                sprints = Sprint.from_raw_batch(
+                    self._options, self._session, r_json["sprints"]
+                )
 
             return ResultList(sprints, 0, len(sprints), len(sprints), True)
         else:
@@ -4024,16 +5045,40 @@ class JIRA(object):
                 self.AGILE_BASE_URL,
             )
 
-    def sprints_by_name(self, id, extended=False):
-        sprints = {}
+    def iter_sprints_by_name(self, id, extended=False):
+        """Iterate over the names and the raw json of the sprints of a board.
+
+        :param id: the board to get the sprints from
+        :type id: int
+        :param extended: see :meth:`sprints`
+        :type extended: bool
+
+        :raises ValueError: when a name is used by a sprint already returned
+        :rtype: Iterator[Tuple[str, Dict[str, Any]]]
+        """
+        names = set()
         for s in self.sprints(id, extended=extended):
-            if s.name not in sprints:
-                sprints[s.name] = s.raw
-            else:
-                raise Exception
-        return sprints
+            if s.name in names:
+                raise ValueError("Duplicate sprint name: %s" % s.name)
+            names.add(s.name)
+            yield s.name, s.raw
+
+    def sprints_by_name(self, id, extended=False):
+        """Get the raw json of the sprints of a board by their name.
+
+        :raises ValueError: when several sprints have the same name
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        return dict(self.iter_sprints_by_name(id, extended=extended))
 
     def update_sprint(self, id, name=None, startDate=None, endDate=None, state=None):
+        """Update the fields of a sprint that are given.
+
+        No request is sent when none of them is given.
+
+        :return: the json of the updated sprint, or None if nothing was updated
+        :rtype: Optional[Dict[str, Any]]
+        """
         payload = {}
         if name:
             payload["name"] = name
@@ -4050,41 +5095,64 @@ class JIRA(object):
                     "Public Jira API does not support state update"
                 )
             payload["state"] = state
+        if not payload:
+            return None
 
         url = self._get_url("sprint/%s" % id, base=self.AGILE_BASE_URL)
-        r = self._session.put(url, data=json.dumps(payload))
+        r = self._session.put(url, data=json_dumps(payload))
 
         return json_loads(r)
 
+    def _sprint_report(self, board_id, sprint_id):
+        """Get the sprint report of a board, reused for ``sprint_report_ttl`` seconds.
+
+        Once that time is over the report is revalidated with its ETag, if any.
+
+        :rtype: Dict[str, Any]
+        """
+        return self._get_metadata(
+            ("sprintreport", str(board_id), str(sprint_id)),
+            lambda: self._get_json_revalidated(
+                "rapid/charts/sprintreport",
+                params={"rapidViewId": board_id, "sprintId": sprint_id},
+                base=self.AGILE_BASE_URL,
+            ),
+            "sprint_report_ttl",
+        )
+
+    def sprint_report(self, board_id, sprint_id):
+        """Return the report of a sprint on a board.
+
+        The incompleted and removed issue estimates and the removed issues are all
+        read from the one request made for it, see :class:`~jira.resources.SprintReport`.
+
+        :param board_id: the board of the sprint
+        :type board_id: int
+        :param sprint_id: the sprint to report on
+        :type sprint_id: int
+
+        :rtype: :class:`~jira.resources.SprintReport`
+        """
+        return SprintReport(
+            self._options, self._session, raw=self._sprint_report(board_id, sprint_id)
+        )
+
     def incompletedIssuesEstimateSum(self, board_id, sprint_id):
         """Return the total incompleted points this sprint."""
-        return self._get_json(
-            "rapid/charts/sprintreport?rapidViewId=%s&sprintId=%s"
-            % (board_id, sprint_id),
-            base=self.AGILE_BASE_URL,
-        )["contents"]["incompletedIssuesEstimateSum"]["value"]
+        r_json = self._sprint_report(board_id, sprint_id)
+        return r_json["contents"]["incompletedIssuesEstimateSum"]["value"]
 
     def removed_issues(self, board_id, sprint_id):
         """Return the completed issues for the sprint."""
-        r_json = self._get_json(
-            "rapid/charts/sprintreport?rapidViewId=%s&sprintId=%s"
-            % (board_id, sprint_id),
-            base=self.AGILE_BASE_URL,
+        r_json = self._sprint_report(board_id, sprint_id)
+        return Issue.from_raw_batch(
+            self._options, self._session, r_json["contents"]["puntedIssues"]
         )
-        issues = [
-            Issue(self._options, self._session, raw_issues_json)
-            for raw_issues_json in r_json["contents"]["puntedIssues"]
-        ]
-
-        return issues
 
     def removedIssuesEstimateSum(self, board_id, sprint_id):
         """Return the total incompleted points this sprint."""
-        return self._get_json(
-            "rapid/charts/sprintreport?rapidViewId=%s&sprintId=%s"
-            % (board_id, sprint_id),
-            base=self.AGILE_BASE_URL,
-        )["contents"]["puntedIssuesEstimateSum"]["value"]
+        r_json = self._sprint_report(board_id, sprint_id)
+        return r_json["contents"]["puntedIssuesEstimateSum"]["value"]
 
     # TODO(ssbarnea): remove sprint_info() method, sprint() method suit the convention more
     def sprint_info(self, board_id, sprint_id):
@@ -4116,6 +5184,30 @@ class JIRA(object):
         board = Board(self._options, self._session, raw={"id": id})
         board.delete()
 
+    def _lookup_project_ids(self, projects):
+        """Return the ids of the projects given by key or id.
+
+        The ids are kept with the ones used to create issues. Those not known yet
+        are looked up in the cached :meth:`projects` listing, falling back to a
+        request per project for those it does not hold.
+
+        :type projects: List[str]
+        :rtype: List[str]
+        """
+        with self._ids_lock:
+            missing = [p for p in projects if p not in self._project_ids]
+        if missing:
+            found = {}
+            for project in self.projects():
+                found[project.key] = found[project.id] = project.id
+            for p in missing:
+                if p not in found:
+                    found[p] = self.project(p).id
+            with self._ids_lock:
+                self._project_ids.update((p, found[p]) for p in missing)
+        with self._ids_lock:
+            return [self._project_ids[p] for p in projects]
+
     def create_board(
         self, name, project_ids, preset="scrum", location_type="user", location_id=None
     ):
@@ -4146,12 +5238,9 @@ class JIRA(object):
 
         payload = {}
         if isinstance(project_ids, str):
-            ids = []
-            for p in project_ids.split(","):
-                ids.append(self.project(p).id)
-            project_ids = ",".join(ids)
+            project_ids = ",".join(self._lookup_project_ids(project_ids.split(",")))
         if location_id is not None:
-            location_id = self.project(location_id).id
+            location_id = self._lookup_project_ids([location_id])[0]
         payload["name"] = name
         if isinstance(project_ids, str):
             project_ids = project_ids.split(",")
@@ -4161,7 +5250,7 @@ class JIRA(object):
             payload["locationType"] = location_type
             payload["locationId"] = location_id
         url = self._get_url("rapidview/create/presets", base=self.AGILE_BASE_URL)
-        r = self._session.post(url, data=json.dumps(payload))
+        r = self._session.post(url, data=json_dumps(payload))
 
         raw_issue_json = json_loads(r)
         return Board(self._options, self._session, raw=raw_issue_json)
@@ -4192,8 +5281,24 @@ class JIRA(object):
             == GreenHopperResource.GREENHOPPER_REST_PATH
         ):
             url = self._get_url("sprint/%s" % board_id, base=self.AGILE_BASE_URL)
-            r = self._session.post(url)
-            raw_issue_json = json_loads(r)
+            raw_issue_json = None
+            if self._greenhopper_create_sprint_oneshot is not False:
+                # the fields are sent with the creation and only set afterwards
+                # if they were not taken, which is then remembered
+                try:
+                    r = self._session.post(url, data=json_dumps(payload))
+                except JIRAError as e:
+                    if e.status_code != 400:
+                        raise
+                else:
+                    raw_issue_json = json_loads(r)
+                    if all(raw_issue_json.get(k) == v for k, v in payload.items()):
+                        self._greenhopper_create_sprint_oneshot = True
+                        return Sprint(self._options, self._session, raw=raw_issue_json)
+                self._greenhopper_create_sprint_oneshot = False
+            if raw_issue_json is None:
+                r = self._session.post(url)
+                raw_issue_json = json_loads(r)
             """ now r contains something like:
             {
                   "id": 742,
@@ -4209,17 +5314,37 @@ class JIRA(object):
             url = self._get_url(
                 "sprint/%s" % raw_issue_json["id"], base=self.AGILE_BASE_URL
             )
-            r = self._session.put(url, data=json.dumps(payload))
+            r = self._session.put(url, data=json_dumps(payload))
             raw_issue_json = json_loads(r)
         else:
             url = self._get_url("sprint", base=self.AGILE_BASE_URL)
             payload["originBoardId"] = board_id
-            r = self._session.post(url, data=json.dumps(payload))
+            r = self._session.post(url, data=json_dumps(payload))
             raw_issue_json = json_loads(r)
 
         return Sprint(self._options, self._session, raw=raw_issue_json)
 
-    def add_issues_to_sprint(self, sprint_id, issue_keys):
+    def _warn_short_pages(self, returned, requested):
+        """Warn, once per client, that the server returns fewer items per page than requested."""
+        if not self._warned_short_pages:
+            self._warned_short_pages = True
+            warnings.warn(
+                "The server returned %s items per page instead of the %s requested"
+                % (returned, requested),
+                Warning,
+                stacklevel=_caller_stacklevel(),
+            )
+
+    def _warn_old_agile_version(self):
+        """Warn, once per client, that a 404 may come from a too old Jira Agile."""
+        if not self._warned_old_agile_version:
+            self._warned_old_agile_version = True
+            warnings.warn(
+                "Status code 404 may mean, that too old Jira Agile version is installed."
+                " At least version 6.7.10 is required."
+            )
+
+    def add_issues_to_sprint(self, sprint_id, issue_keys, chunk_size=50):
         """Add the issues in ``issue_keys`` to the ``sprint_id``.
 
         The sprint must be started but not completed.
@@ -4236,25 +5361,29 @@ class JIRA(object):
         :type sprint_id: int
         :param issue_keys: the issues to add to the sprint
         :type issue_keys: List[str]
+        :param chunk_size: the maximum number of issues sent in one request, the
+            requests being sent concurrently when the ``async`` option is set. Jira
+            Agile accepts at most 50 issues at once. (Default: 50)
+        :type chunk_size: Optional[int]
 
         :rtype: Response
         """
-        if self._options["agile_rest_path"] == GreenHopperResource.AGILE_BASE_REST_PATH:
+        chunks = self._chunks(issue_keys, chunk_size)
+        agile_rest_path = self._options["agile_rest_path"]
+        if agile_rest_path == GreenHopperResource.AGILE_BASE_REST_PATH:
             url = self._get_url("sprint/%s/issue" % sprint_id, base=self.AGILE_BASE_URL)
-            payload = {"issues": issue_keys}
             try:
-                self._session.post(url, data=json.dumps(payload))
+                self._map(
+                    lambda chunk: self._session.post(
+                        url, data=json_dumps({"issues": chunk})
+                    ),
+                    chunks,
+                )
             except JIRAError as e:
                 if e.status_code == 404:
-                    warnings.warn(
-                        "Status code 404 may mean, that too old Jira Agile version is installed."
-                        " At least version 6.7.10 is required."
-                    )
+                    self._warn_old_agile_version()
                 raise
-        elif (
-            self._options["agile_rest_path"]
-            == GreenHopperResource.GREENHOPPER_REST_PATH
-        ):
+        elif agile_rest_path == GreenHopperResource.GREENHOPPER_REST_PATH:
             # In old, private API the function does not exist anymore and we need to use
             # issue.update() to perform this operation
             # Workaround based on https://answers.atlassian.com/questions/277651/jira-agile-rest-api-example
@@ -4262,20 +5391,24 @@ class JIRA(object):
             sprint_field_id = self._get_sprint_field_id()
 
             data = {
-                "idOrKeys": issue_keys,
                 "customFieldId": sprint_field_id,
                 "sprintId": sprint_id,
                 "addToBacklog": False,
             }
             url = self._get_url("sprint/rank", base=self.AGILE_BASE_URL)
-            return self._session.put(url, data=json.dumps(data))
+            return self._map(
+                lambda chunk: self._session.put(
+                    url, data=json_dumps({"idOrKeys": chunk, **data})
+                ),
+                chunks,
+            )[-1]
         else:
             raise NotImplementedError(
                 'No API for adding issues to sprint for agile_rest_path="%s"'
-                % self._options["agile_rest_path"]
+                % agile_rest_path
             )
 
-    def add_issues_to_epic(self, epic_id, issue_keys, ignore_epics=True):
+    def add_issues_to_epic(self, epic_id, issue_keys, ignore_epics=True, chunk_size=50):
         """Add the issues in ``issue_keys`` to the ``epic_id``.
 
         :param epic_id: The ID for the epic where issues should be added.
@@ -4284,6 +5417,9 @@ class JIRA(object):
         :type issue_keys: str
         :param ignore_epics: ignore any issues listed in ``issue_keys`` that are epics. (Default: True)
         :type ignore_epics: bool
+        :param chunk_size: the maximum number of issues sent in one request, see
+            :meth:`add_issues_to_sprint`. (Default: 50)
+        :type chunk_size: Optional[int]
 
         """
         if (
@@ -4295,11 +5431,14 @@ class JIRA(object):
                 "Jira Agile Public API does not support this request"
             )
 
-        data = {}
-        data["issueKeys"] = issue_keys
-        data["ignoreEpics"] = ignore_epics
         url = self._get_url("epics/%s/add" % epic_id, base=self.AGILE_BASE_URL)
-        return self._session.put(url, data=json.dumps(data))
+        return self._map(
+            lambda chunk: self._session.put(
+                url,
+                data=json_dumps({"issueKeys": chunk, "ignoreEpics": ignore_epics}),
+            ),
+            self._chunks(issue_keys, chunk_size),
+        )[-1]
 
     # TODO(ssbarnea): Both GreenHopper and new Jira Agile API support moving more than one issue.
     def rank(self, issue, next_issue):
@@ -4308,7 +5447,9 @@ class JIRA(object):
         :param issue: issue key of the issue to be ranked before the second one.
         :param next_issue: issue key of the second issue.
         """
-        if not self._rank:
+        # the lookup is not repeated when no Rank field was found, but it is
+        # when it failed
+        if not self._rank_looked_up:
             for field in self.fields():
                 if field["name"] == "Rank":
                     if (
@@ -4323,8 +5464,10 @@ class JIRA(object):
                     ):
                         # Obsolete since Jira v6.3.13.1
                         self._rank = field["schema"]["customId"]
+            self._rank_looked_up = True
 
-        if self._options["agile_rest_path"] == GreenHopperResource.AGILE_BASE_REST_PATH:
+        agile_rest_path = self._options["agile_rest_path"]
+        if agile_rest_path == GreenHopperResource.AGILE_BASE_REST_PATH:
             url = self._get_url("issue/rank", base=self.AGILE_BASE_URL)
             payload = {
                 "issues": [issue],
@@ -4332,72 +5475,69 @@ class JIRA(object):
                 "rankCustomFieldId": self._rank,
             }
             try:
-                return self._session.put(url, data=json.dumps(payload))
+                return self._session.put(url, data=json_dumps(payload))
             except JIRAError as e:
                 if e.status_code == 404:
-                    warnings.warn(
-                        "Status code 404 may mean, that too old Jira Agile version is installed."
-                        " At least version 6.7.10 is required."
-                    )
+                    self._warn_old_agile_version()
                 raise
-        elif (
-            self._options["agile_rest_path"]
-            == GreenHopperResource.GREENHOPPER_REST_PATH
-        ):
+        elif agile_rest_path == GreenHopperResource.GREENHOPPER_REST_PATH:
             data = {
                 "issueKeys": [issue],
                 "rankBeforeKey": next_issue,
                 "customFieldId": self._rank,
             }
             url = self._get_url("rank", base=self.AGILE_BASE_URL)
-            return self._session.put(url, data=json.dumps(data))
+            return self._session.put(url, data=json_dumps(data))
         else:
             raise NotImplementedError(
-                'No API for ranking issues for agile_rest_path="%s"'
-                % self._options["agile_rest_path"]
+                'No API for ranking issues for agile_rest_path="%s"' % agile_rest_path
             )
 
-    def move_to_backlog(self, issue_keys):
+    def move_to_backlog(self, issue_keys, chunk_size=50):
         """Move issues in ``issue_keys`` to the backlog, removing them from all sprints that have not been completed.
 
         :param issue_keys: the issues to move to the backlog
         :param issue_keys: str
+        :param chunk_size: the maximum number of issues sent in one request, see
+            :meth:`add_issues_to_sprint`. (Default: 50)
+        :type chunk_size: Optional[int]
 
         :raises JIRAError: If moving issues to backlog fails
         """
-        if self._options["agile_rest_path"] == GreenHopperResource.AGILE_BASE_REST_PATH:
+        chunks = self._chunks(issue_keys, chunk_size)
+        agile_rest_path = self._options["agile_rest_path"]
+        if agile_rest_path == GreenHopperResource.AGILE_BASE_REST_PATH:
             url = self._get_url("backlog/issue", base=self.AGILE_BASE_URL)
-            payload = {"issues": issue_keys}
             try:
-                self._session.post(url, data=json.dumps(payload))
+                self._map(
+                    lambda chunk: self._session.post(
+                        url, data=json_dumps({"issues": chunk})
+                    ),
+                    chunks,
+                )
             except JIRAError as e:
                 if e.status_code == 404:
-                    warnings.warn(
-                        "Status code 404 may mean, that too old Jira Agile version is installed."
-                        " At least version 6.7.10 is required."
-                    )
+                    self._warn_old_agile_version()
                 raise
-        elif (
-            self._options["agile_rest_path"]
-            == GreenHopperResource.GREENHOPPER_REST_PATH
-        ):
+        elif agile_rest_path == GreenHopperResource.GREENHOPPER_REST_PATH:
             # In old, private API the function does not exist anymore and we need to use
             # issue.update() to perform this operation
             # Workaround based on https://answers.atlassian.com/questions/277651/jira-agile-rest-api-example
 
             sprint_field_id = self._get_sprint_field_id()
 
-            data = {
-                "idOrKeys": issue_keys,
-                "customFieldId": sprint_field_id,
-                "addToBacklog": True,
-            }
+            data = {"customFieldId": sprint_field_id, "addToBacklog": True}
             url = self._get_url("sprint/rank", base=self.AGILE_BASE_URL)
-            return self._session.put(url, data=json.dumps(data))
+            return self._map(
+                lambda chunk: self._session.put(
+                    url, data=json_dumps({"idOrKeys": chunk, **data})
+                ),
+                chunks,
+            )[-1]
         else:
             raise NotImplementedError(
                 'No API for moving issues to backlog for agile_rest_path="%s"'
-                % self._options["agile_rest_path"]
+                % agile_rest_path
             )
 
 
@@ -6,6 +6,7 @@ import logging
 import random
 from requests.exceptions import ConnectionError
 from requests import Session
+import threading
 import time
 
 from jira.exceptions import JIRAError
@@ -68,15 +69,37 @@ def raise_on_error(r, verb="???", **kwargs):
         pass
 
 
+def _retry_after(response):
+    """Return the number of seconds to wait asked by a response, if any.
+
+    :rtype: Optional[float]
+    """
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        # missing, or an HTTP date
+        return None
+
+
 class ResilientSession(Session):
     """This class is supposed to retry requests that do return temporary errors.
 
     At this moment it supports: 502, 503, 504
+
+    Requests rejected by the rate limiter (429) are retried after the delay asked by
+    the server, and once the server reports the rate limit is reached, requests are
+    spaced according to its fill rate.
     """
 
     def __init__(self, timeout=None):
         self.max_retries = 3
         self.timeout = timeout
+        # time until which a 429 asked to wait, and while the rate limit is
+        # reached, the time of the next request and the spacing between them
+        self._retry_time = 0.0
+        self._next_request_time = 0.0
+        self._request_interval = 0.0
+        self._rate_limit_lock = threading.Lock()
         super(ResilientSession, self).__init__()
 
         # Indicate our preference for JSON to avoid https://bitbucket.org/bspeakmon/jira-python/issue/46 and https://jira.atlassian.com/browse/JRA-38551
@@ -97,6 +120,21 @@ class ResilientSession(Session):
                 )
             )
         if hasattr(response, "status_code"):
+            if response.status_code == 429:
+                delay = _retry_after(response)
+                if delay is None:
+                    delay = min(60, 10 * 2 ** counter) * random.random()
+                logging.warning(
+                    "Got 429 from %s %s, will retry [%s/%s] in %ss.",
+                    request,
+                    url,
+                    counter,
+                    self.max_retries,
+                    delay,
+                )
+                with self._rate_limit_lock:
+                    self._retry_time = max(self._retry_time, time.monotonic() + delay)
+                return True
             if response.status_code in [502, 503, 504, 401]:
                 # 401 UNAUTHORIZED still randomly returned by Atlassian Cloud as of 2017-01-16
                 msg = "%s %s" % (response.status_code, response.reason)
@@ -123,6 +161,44 @@ class ResilientSession(Session):
         time.sleep(delay)
         return True
 
+    def __wait_for_rate_limit(self):
+        """Sleep until the rate limit of the server allows another request."""
+        if not self._next_request_time and self._retry_time <= time.monotonic():
+            return
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            start = max(now, self._retry_time, self._next_request_time)
+            if self._next_request_time:
+                self._next_request_time = start + self._request_interval
+        if start > now:
+            time.sleep(start - now)
+
+    def __update_rate_limit(self, response):
+        """Space the next requests when the response says the rate limit is reached.
+
+        Jira Cloud refills ``X-RateLimit-FillRate`` requests every
+        ``X-RateLimit-Interval-Seconds``, up to ``X-RateLimit-Limit``.
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        interval = 0.0
+        try:
+            if int(remaining) <= 0:
+                interval = float(
+                    response.headers["X-RateLimit-Interval-Seconds"]
+                ) / float(response.headers["X-RateLimit-FillRate"])
+        except (KeyError, ValueError, ZeroDivisionError):
+            pass
+        with self._rate_limit_lock:
+            self._request_interval = interval
+            if interval:
+                self._next_request_time = max(
+                    self._next_request_time, time.monotonic() + interval
+                )
+            else:
+                self._next_request_time = 0.0
+
     def __verb(self, verb, url, retry_data=None, **kwargs):
 
         d = self.headers.copy()
@@ -139,10 +215,15 @@ class ResilientSession(Session):
         while retry_number <= self.max_retries:
             response = None
             exception = None
+            self.__wait_for_rate_limit()
             try:
                 method = getattr(super(ResilientSession, self), verb.lower())
                 response = method(url, timeout=self.timeout, **kwargs)
-                if response.status_code >= 200 and response.status_code <= 299:
+                self.__update_rate_limit(response)
+                if (
+                    response.status_code >= 200 and response.status_code <= 299
+                ) or response.status_code == 304:
+                    # 304 only answers conditional requests, which expect it
                     return response
             except ConnectionError as e:
                 logging.warning(
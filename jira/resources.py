@@ -12,7 +12,6 @@ import json
 
 from jira.utils import CaseInsensitiveDict
 from jira.utils import json_loads
-from jira.utils import threaded_requests
 
 __all__ = (
     "Resource",
@@ -242,9 +241,7 @@ class Resource(object):
         :rtype: str
 
         """
-        options = self._options.copy()
-        options.update({"path": path})
-        return self._base_url.format(**options)
+        return self._base_url.format(**{**self._options, "path": path})
 
     def update(self, fields=None, async_=None, jira=None, notify=True, **kwargs):
         """Update this resource on the server.
@@ -344,10 +341,11 @@ class Resource(object):
                 #    data['fields']['assignee'] = {'name': self._options['autofix']}
             # EXPERIMENTAL --->
             if async_:
+                # sent by JIRA.async_do()
                 if not hasattr(self._session, "_async_jobs"):
-                    self._session._async_jobs = set()
-                self._session._async_jobs.add(
-                    threaded_requests.put(self.self, data=json.dumps(data))
+                    self._session._async_jobs = []
+                self._session._async_jobs.append(
+                    (self._session.put, self.self, {"data": json.dumps(data)})
                 )
             else:
                 r = self._session.put(self.self, data=json.dumps(data))
@@ -368,10 +366,11 @@ class Resource(object):
         :rtype: Response
         """
         if self._options["async"]:
+            # sent by JIRA.async_do()
             if not hasattr(self._session, "_async_jobs"):
-                self._session._async_jobs = set()
-            self._session._async_jobs.add(
-                threaded_requests.delete(url=self.self, params=params)
+                self._session._async_jobs = []
+            self._session._async_jobs.append(
+                (self._session.delete, self.self, {"params": params})
             )
         else:
             return self._session.delete(url=self.self, params=params)
@@ -405,6 +404,30 @@ class Resource(object):
             raise NotImplementedError("We cannot instantiate empty resources: %s" % raw)
         dict2resource(raw, self, self._options, self._session)
 
+    @classmethod
+    def from_raw_batch(cls, options, session, raws):
+        """Create a list of resources of this type from a list of raw dictionaries.
+
+        Equivalent to ``[cls(options, session, raw) for raw in raws]``, but the
+        constructor only runs once: its attributes are copied to every item before
+        parsing the raw dictionary.
+
+        :type options: Dict[str, str]
+        :type session: ResilientSession
+        :type raws: Iterable[Dict[str, Any]]
+        :rtype: List[Resource]
+        """
+        defaults = cls(options, session).__dict__
+        new = cls.__new__
+        resources = []
+        for raw in raws:
+            resource = new(cls)
+            resource.__dict__.update(defaults)
+            if raw:
+                resource._parse_raw(raw)
+            resources.append(resource)
+        return resources
+
     def _default_headers(self, user_headers):
         # result = dict(user_headers)
         # result['accept'] = 'application/json'
@@ -939,6 +962,18 @@ class GreenHopperResource(Resource):
             if not self.self:
                 self.self = self._get_url(path.format(raw["id"]))
 
+    @classmethod
+    def from_raw_batch(cls, options, session, raws):
+        resources = super(GreenHopperResource, cls).from_raw_batch(
+            options, session, raws
+        )
+        for resource in resources:
+            if resource.raw and not resource.self:
+                resource.self = resource._get_url(
+                    resource._resource.format(resource.raw["id"])
+                )
+        return resources
+
 
 class Sprint(GreenHopperResource):
     """A GreenHopper sprint."""
@@ -958,6 +993,47 @@ class Sprint(GreenHopperResource):
             self._load(url, params=params, path="sprint")
 
 
+class SprintReport(GreenHopperResource):
+    """The report of a GreenHopper sprint on a board, only available from the old API.
+
+    Its ``contents`` hold the issues of the sprint and their estimates, a few of
+    which are also exposed as properties.
+    """
+
+    def __init__(self, options, session, raw=None):
+        # the report has no id, the self link of GreenHopperResource cannot be made
+        self.self = None
+        Resource.__init__(
+            self,
+            "rapid/charts/sprintreport?rapidViewId={0}&sprintId={1}",
+            options,
+            session,
+            self.AGILE_BASE_URL,
+        )
+        if raw:
+            self._parse_raw(raw)
+
+    @property
+    def incompleted_issues_estimate_sum(self):
+        """The total of the points not completed in the sprint."""
+        return self.raw["contents"]["incompletedIssuesEstimateSum"]["value"]
+
+    @property
+    def removed_issues(self):
+        """The issues removed from the sprint.
+
+        :rtype: List[Issue]
+        """
+        return Issue.from_raw_batch(
+            self._options, self._session, self.raw["contents"]["puntedIssues"]
+        )
+
+    @property
+    def removed_issues_estimate_sum(self):
+        """The total of the points removed from the sprint."""
+        return self.raw["contents"]["puntedIssuesEstimateSum"]["value"]
+
+
 class Board(GreenHopperResource):
     """A GreenHopper board."""
 
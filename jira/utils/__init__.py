@@ -1,9 +1,28 @@
 # -*- coding: utf-8 -*-
 """Jira utils used internally."""
+import json
 import threading
 
 from jira.resilientsession import raise_on_error
 
+try:
+    # orjson and jiter parse UTF-8 bytes directly and are much faster than the
+    # stdlib on large responses; fall back to ``Response.json()`` without them.
+    from orjson import loads as _loads
+except ImportError:
+    try:
+        from jiter import from_json as _loads
+    except ImportError:
+        _loads = None
+
+try:
+    from orjson import dumps as _dumps
+except ImportError:
+    _dumps = None
+
+# without the spaces json.dumps puts after separators by default
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
 
 class CaseInsensitiveDict(dict):
     """A case-insensitive ``dict``-like object.
@@ -74,9 +93,43 @@ def threaded_requests(requests):
 def json_loads(r):
     raise_on_error(r)
     try:
-        return r.json()
+        if _loads is None:
+            return r.json()
+        return _loads(r.content)
     except ValueError:
         # json.loads() fails with empty bodies
-        if not r.text:
+        if not r.content:
             return {}
         raise
+
+
+def json_loads_bytes(content):
+    """Parse a JSON body read without requests, like :py:func:`json_loads` does.
+
+    :type content: bytes
+    :rtype: Any
+    """
+    if not content:
+        return {}
+    if _loads is None:
+        return json.loads(content)
+    return _loads(content)
+
+
+def json_dumps(obj):
+    """Serialize obj to be sent as the JSON body of a request.
+
+    Uses orjson when it is installed, in which case UTF-8 encoded bytes are
+    returned instead of a str. requests accepts both as ``data``. Either way
+    the output is compact, without whitespace between the items.
+
+    :type obj: Any
+    :rtype: Union[bytes, str]
+    """
+    if _dumps is not None:
+        try:
+            return _dumps(obj)
+        except TypeError:
+            # e.g. non-str dict keys, which the json module converts
+            pass
+    return _encode(obj)
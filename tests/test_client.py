@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
+import datetime
 import getpass
+import json
 import pytest
+import requests
+import requests_mock
 
 # from tenacity import retry
 # from tenacity import wait_incrementing
@@ -8,7 +12,10 @@ from tests import get_unique_project_name
 from tests import JiraTestManager
 
 from jira import Role, Issue, JIRA, JIRAError, Project  # noqa
+from jira.resources import Board
 import jira.client
+import jira.resilientsession
+import jira.utils
 
 
 @pytest.fixture()
@@ -129,3 +136,1280 @@ def test_result_list_if_empty():
 
     with pytest.raises(StopIteration):
         next(results)
+
+
+def test_json_loads():
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{"key": "PRJ-1", "summary": "\xc3\xa9t\xc3\xa9"}'
+    assert jira.utils.json_loads(response) == {"key": "PRJ-1", "summary": "été"}
+
+    response._content = b""
+    assert jira.utils.json_loads(response) == {}
+
+
+def test_json_loads_bytes():
+    content = b'{"key": "PRJ-1", "summary": "\xc3\xa9t\xc3\xa9"}'
+    assert jira.utils.json_loads_bytes(content) == {"key": "PRJ-1", "summary": "été"}
+    assert jira.utils.json_loads_bytes(b"") == {}
+
+
+def test_result_list_lazy():
+    results = jira.client.ResultList((i for i in [2, 3]), 0, 50, 2)
+
+    assert next(results) == 2
+    assert list(results) == [3]
+    with pytest.raises(StopIteration):
+        next(results)
+
+
+@pytest.fixture()
+def offline_jira():
+    with requests_mock.Mocker() as mocker:
+        mocker.get("http://localhost:2990/jira/rest/api/2/field", json=[])
+        client = JIRA(get_server_info=False)
+        client.mocker = mocker
+        yield client
+        client.close()
+
+
+def _issues_page(start_at, max_results, total):
+    keys = range(start_at, min(start_at + max_results, total))
+    return {
+        "startAt": start_at,
+        "maxResults": max_results,
+        "total": total,
+        "issues": [{"key": "PRJ-%s" % i, "fields": {}} for i in keys],
+    }
+
+
+@pytest.mark.parametrize("async_", [False, True])
+def test_fetch_pages_offline(offline_jira, async_):
+    offline_jira._options["async"] = async_
+
+    def search(request, context):
+        start_at = int(request.qs.get("startat", [0])[0])
+        return _issues_page(start_at, 2, 5)
+
+    offline_jira.mocker.get("http://localhost:2990/jira/rest/api/2/search", json=search)
+
+    params = {"jql": "project=PRJ"}
+    issues = offline_jira._fetch_pages(Issue, "issues", "search", 0, False, params)
+
+    assert [i.key for i in issues] == ["PRJ-0", "PRJ-1", "PRJ-2", "PRJ-3", "PRJ-4"]
+    assert issues.total == 5
+
+
+def test_cache_fields_offline():
+    jira.client._server_cache.cache_clear()
+    options = {"server": "http://jira.example.com", "cache_fields": True}
+    with requests_mock.Mocker() as mocker:
+        fields = mocker.get(
+            "http://jira.example.com/rest/api/2/field",
+            json=[{"id": "summary", "clauseNames": ["summary"]}],
+        )
+        for _ in range(2):
+            client = JIRA(
+                options=options, basic_auth=("user", "pass"), get_server_info=False
+            )
+            assert client._fields == {"summary": "summary"}
+        JIRA(options=options, basic_auth=("other", "pass"), get_server_info=False)
+
+    assert fields.call_count == 2
+
+
+def test_fetch_pages_is_last_offline(offline_jira):
+    def boards(request, context):
+        start_at = int(request.qs.get("startat", [0])[0])
+        return {
+            "startAt": start_at,
+            "maxResults": 2,
+            "isLast": start_at >= 2,
+            "values": [
+                {"id": i, "self": "board/%s" % i} for i in (start_at, start_at + 1)
+            ],
+        }
+
+    offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/agile/1.0/board", json=boards
+    )
+    offline_jira._options["agile_rest_path"] = "agile"
+
+    results = offline_jira._fetch_pages(
+        Board, "values", "board", 0, False, base=offline_jira.AGILE_BASE_URL
+    )
+
+    assert [b.id for b in results] == [0, 1, 2, 3]
+    assert offline_jira.mocker.call_count == 3
+
+
+def test_json_dumps():
+    payload = {"fields": {"summary": "été", "labels": ["a", "b"]}}
+    assert json.loads(jira.utils.json_dumps(payload)) == payload
+    assert json.loads(jira.utils.json_dumps({1: "one"})) == {"1": "one"}
+    assert jira.utils.json_dumps({1: [1, 2]}) == '{"1":[1,2]}'
+
+
+@pytest.mark.parametrize("async_", [False, True])
+@pytest.mark.parametrize(
+    "first_page, page, exclusive",
+    [(50, 50, False), (20, 20, False), (50, 30, False), (50, 50, True)],
+)
+def test_group_members_offline(offline_jira, async_, first_page, page, exclusive):
+    offline_jira._options["async"] = async_
+    offline_jira._version = (8, 0, 0)
+
+    def group(request, context):
+        expand = request.qs["expand"][0]
+        start, end = 0, first_page - 1
+        if expand != "users":
+            start, end = [int(i) for i in expand[len("users[") : -1].split(":")]
+            end = min(end - exclusive, start + page - 1)
+        end = min(end, 119)
+        users = [
+            {"key": "u%03d" % i, "name": "u%d" % i, "displayName": "U", "active": True}
+            for i in range(start, end + 1)
+        ]
+        return {"users": {"size": 120, "end-index": end, "items": users}}
+
+    offline_jira.mocker.get("http://localhost:2990/jira/rest/api/2/group", json=group)
+
+    members = offline_jira.group_members("devs")
+
+    assert list(members) == ["u%03d" % i for i in range(120)]
+    assert members["u007"]["email"] == "hidden"
+
+
+def test_async_do_offline(offline_jira):
+    offline_jira._options["async"] = True
+    url = "http://localhost:2990/jira/rest/api/2/issue/10001"
+    deleted = offline_jira.mocker.delete(url, status_code=204)
+    issue = Issue(offline_jira._options, offline_jira._session, {"self": url})
+
+    issue.delete()
+    assert not deleted.called
+
+    offline_jira.async_do(size=2)
+    assert deleted.call_count == 1
+    offline_jira.async_do(size=2)
+    assert deleted.call_count == 1
+
+
+def test_create_issues_prefetch_offline(offline_jira):
+    base = "http://localhost:2990/jira/rest/api/2/"
+    offline_jira.mocker.post(
+        base + "issue/bulk",
+        json={
+            "issues": [{"id": "1", "key": "PRJ-1"}, {"id": "2", "key": "PRJ-2"}],
+            "errors": [
+                {"failedElementNumber": 1, "elementErrors": {"errors": {"x": "y"}}}
+            ],
+        },
+    )
+    search = offline_jira.mocker.get(base + "search", json=_issues_page(1, 50, 2))
+    single = offline_jira.mocker.get(
+        base + "issue/PRJ-2", json={"key": "PRJ-2", "fields": {}}
+    )
+    fields = {"project": {"id": "1"}, "issuetype": {"id": "1"}}
+
+    results = offline_jira.create_issues([fields, fields, fields])
+
+    assert [r["status"] for r in results] == ["Success", "Error", "Success"]
+    assert [r["issue"].key for r in results if r["issue"]] == ["PRJ-1", "PRJ-2"]
+    assert search.call_count == 1
+    assert single.call_count == 1
+
+
+def test_create_issues_all_failed_offline(offline_jira):
+    offline_jira.mocker.post(
+        "http://localhost:2990/jira/rest/api/2/issue/bulk",
+        status_code=400,
+        json={
+            "issues": [],
+            "errors": [
+                {"failedElementNumber": i, "elementErrors": {"errors": {"x": "y"}}}
+                for i in range(2)
+            ],
+        },
+    )
+    fields = {"project": {"id": "1"}, "issuetype": {"id": "1"}}
+
+    results = offline_jira.create_issues([fields, fields])
+
+    assert [r["status"] for r in results] == ["Error", "Error"]
+    assert [r["error"] for r in results] == [{"x": "y"}, {"x": "y"}]
+
+
+def test_create_issues_issue_types_offline(offline_jira):
+    base = "http://localhost:2990/jira/rest/api/2/"
+    issuetype = offline_jira.mocker.get(
+        base + "issuetype",
+        json=[
+            {"id": "1", "name": "Bug"},
+            {"id": "2", "name": "Task"},
+            {"id": "3", "name": "Bug"},
+        ],
+    )
+    issues = [{"id": str(i), "key": "PRJ-%s" % i} for i in range(3)]
+    bulk = offline_jira.mocker.post(
+        base + "issue/bulk", json={"issues": issues, "errors": []}
+    )
+    field_list = [
+        {"project": {"id": "1"}, "issuetype": name} for name in ("Bug", "Task", "Bug")
+    ]
+
+    offline_jira.create_issues(field_list, prefetch=False)
+
+    assert issuetype.call_count == 1
+    sent = [u["fields"]["issuetype"] for u in bulk.last_request.json()["issueUpdates"]]
+    assert sent == [{"id": "1"}, {"id": "2"}, {"id": "1"}]
+
+
+def test_create_issue_issue_type_name_offline(offline_jira):
+    base = "http://localhost:2990/jira/rest/api/2/"
+    offline_jira.mocker.get(base + "project/PRJ", json={"id": "10", "key": "PRJ"})
+    offline_jira.mocker.get(
+        base + "issuetype",
+        json=[{"id": "1", "name": "Bug"}],
+        headers={"ETag": '"v1"'},
+    )
+    create = offline_jira.mocker.post(
+        base + "issue", json={"id": "1", "key": "PRJ-1", "fields": {}}
+    )
+
+    issue = offline_jira.create_issue(
+        fields={"project": "PRJ", "issuetype": "Bug", "summary": "x"},
+        prefetch=False,
+    )
+
+    assert issue.key == "PRJ-1"
+    fields = create.last_request.json()["fields"]
+    assert fields["project"] == {"id": "10"}
+    assert fields["issuetype"] == {"id": "1"}
+
+
+def test_applicationlinks_ttl_offline(offline_jira, monkeypatch):
+    applink = {"application": {"id": "1", "displayUrl": "http://other"}}
+    applinks = offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/applinks/latest/listApplicationlinks",
+        json={"list": [applink]},
+    )
+    now = [1000.0]
+    monkeypatch.setattr(jira.client.time, "monotonic", lambda: now[0])
+
+    assert offline_jira.applicationlinks() == [applink]
+    offline_jira.applicationlinks()
+    assert applinks.call_count == 1
+
+    now[0] += 301
+    offline_jira.applicationlinks()
+    assert applinks.call_count == 2
+    offline_jira.applicationlinks(ttl=600)
+    assert applinks.call_count == 2
+
+
+def test_transition_by_name_offline(offline_jira):
+    url = "http://localhost:2990/jira/rest/api/2/issue/PRJ-1/transitions"
+    transitions = offline_jira.mocker.get(
+        url,
+        json={
+            "transitions": [
+                {"id": "11", "name": "Start"},
+                {"id": "21", "name": "Done"},
+                {"id": "31", "name": "done"},
+            ]
+        },
+    )
+    post = offline_jira.mocker.post(url, json={})
+
+    assert offline_jira.find_transitionid_by_name("PRJ-1", "DONE") == "21"
+    assert offline_jira.find_transitionid_by_name("PRJ-1", "none") is None
+    assert transitions.call_count == 1
+
+    offline_jira.transition_issue("PRJ-1", "start")
+    assert post.last_request.json()["transition"] == {"id": "11"}
+    offline_jira.transition_issue("PRJ-1", "Done")
+    assert transitions.call_count == 2
+
+    offline_jira.transition_issue("PRJ-1", " 21")
+    assert post.last_request.json()["transition"] == {"id": 21}
+    with pytest.raises(JIRAError):
+        offline_jira.transition_issue("PRJ-1", "\u00b2")
+
+
+def test_transitions_cache_size_offline(offline_jira, monkeypatch):
+    monkeypatch.setattr(jira.client, "_TRANSITIONS_SIZE", 2)
+    offline_jira.mocker.get(
+        requests_mock.ANY, json={"transitions": [{"id": "11", "name": "Start"}]}
+    )
+
+    for key in ("PRJ-1", "PRJ-2", "PRJ-1", "PRJ-3"):
+        assert offline_jira.find_transitionid_by_name(key, "start") == "11"
+
+    assert list(offline_jira._transitions_cache) == ["PRJ-1", "PRJ-3"]
+
+
+def test_assign_issue_account_id_offline(offline_jira):
+    search = offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/api/2/user/search",
+        json=[{"accountId": "5b10a2844c20165700ede21g", "name": "bob"}],
+    )
+    assignee = offline_jira.mocker.put(
+        "http://localhost:2990/jira/rest/api/latest/issue/PRJ-1/assignee",
+        status_code=204,
+    )
+
+    offline_jira.assign_issue("PRJ-1", "bob")
+    offline_jira.assign_issue("PRJ-1", "bob")
+
+    assert search.call_count == 1
+    assert assignee.last_request.json() == {"accountId": "5b10a2844c20165700ede21g"}
+
+
+def test_create_issue_link_offline(offline_jira):
+    base = "http://localhost:2990/jira/rest/api/2/"
+    link_types = offline_jira.mocker.get(
+        base + "issueLinkType",
+        json={
+            "issueLinkTypes": [
+                {
+                    "id": "1",
+                    "name": "Blocks",
+                    "inward": "is blocked by",
+                    "outward": "blocks",
+                },
+                {
+                    "id": "2",
+                    "name": "Cloners",
+                    "inward": "is cloned by",
+                    "outward": "clones",
+                },
+            ]
+        },
+    )
+    link = offline_jira.mocker.post(base + "issueLink", status_code=201)
+
+    offline_jira.create_issue_link("blocks", "PRJ-1", "PRJ-2")
+    assert link.last_request.json()["type"] == {"name": "Blocks"}
+    assert link.last_request.json()["inwardIssue"] == {"key": "PRJ-1"}
+    offline_jira.create_issue_link("is cloned by", "PRJ-1", "PRJ-2")
+    assert link.last_request.json()["type"] == {"name": "Cloners"}
+    assert link.last_request.json()["inwardIssue"] == {"key": "PRJ-2"}
+    offline_jira.create_issue_link("Blocks", "PRJ-1", "PRJ-2")
+    assert link.last_request.json()["type"] == {"name": "Blocks"}
+
+    assert link_types.call_count == 1
+
+
+def test_metadata_ttl_offline(offline_jira, monkeypatch):
+    issuetype = offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/api/2/issuetype",
+        json=[{"id": "1", "name": "Bug"}, {"id": "2", "name": "Task"}],
+    )
+    now = [1000.0]
+    monkeypatch.setattr(jira.client.time, "monotonic", lambda: now[0])
+
+    offline_jira.issue_types()
+    offline_jira.issue_types()
+    assert issuetype.call_count == 2
+
+    offline_jira._options["metadata_ttl"] = 300
+    assert offline_jira.issue_type_by_name("Task").id == "2"
+    assert [it.name for it in offline_jira.issue_types()] == ["Bug", "Task"]
+    with pytest.raises(KeyError):
+        offline_jira.issue_type_by_name("Epic")
+    assert issuetype.call_count == 3
+
+    now[0] += 300
+    offline_jira.issue_types()
+    assert issuetype.call_count == 4
+
+
+def test_add_remote_link_offline(offline_jira):
+    offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/applinks/latest/listApplicationlinks",
+        json={
+            "list": [
+                {"application": {"id": "a", "name": "A", "displayUrl": "http://a"}},
+                {"application": {"id": "b", "name": "B", "displayUrl": "http://b"}},
+                {"application": {"id": "c", "name": "C", "displayUrl": "http://b"}},
+            ]
+        },
+    )
+    remotelink = offline_jira.mocker.post(
+        "http://localhost:2990/jira/rest/api/2/issue/PRJ-1/remotelink",
+        json={"id": 1},
+    )
+    destination = Issue(
+        {**offline_jira._options, "server": "http://b"},
+        offline_jira._session,
+        raw={"id": "10", "key": "OTHER-1", "self": "http://b/issue/10"},
+    )
+
+    offline_jira.add_remote_link("PRJ-1", destination)
+
+    data = remotelink.last_request.json()
+    assert data["globalId"] == "appId=b&issueId=10"
+    assert data["application"] == {"name": "B", "type": "com.atlassian.jira"}
+
+
+@pytest.mark.parametrize("streamed", [False, True])
+def test_comments_offline(offline_jira, monkeypatch, streamed):
+    if not streamed:
+        monkeypatch.setattr(jira.client, "_get_ijson", lambda: None)
+    elif jira.client._get_ijson() is None:
+        pytest.skip("ijson is not installed")
+    offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/api/2/issue/PRJ-1/comment",
+        json={
+            "comments": [{"id": "1", "body": "one"}, {"id": "2", "body": "two"}],
+            "total": 2,
+        },
+    )
+
+    comments = offline_jira.comments("PRJ-1")
+
+    assert [(c.id, c.body) for c in comments] == [("1", "one"), ("2", "two")]
+
+
+def test_worklogs_pages_offline(offline_jira):
+    def worklogs(request, context):
+        start_at = int(request.qs["startat"][0]) if "startat" in request.qs else 0
+        ids = range(start_at, min(start_at + 2, 3))
+        return {
+            "startAt": start_at,
+            "maxResults": 2,
+            "total": 3,
+            "worklogs": [{"id": str(i)} for i in ids],
+        }
+
+    offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/api/2/issue/PRJ-1/worklog", json=worklogs
+    )
+
+    assert [w.id for w in offline_jira.worklogs("PRJ-1")] == ["0", "1"]
+    assert [w.id for w in offline_jira.worklogs("PRJ-1", maxResults=False)] == [
+        "0",
+        "1",
+        "2",
+    ]
+    with pytest.warns(Warning, match="2 items per page instead of the 100") as record:
+        assert len(offline_jira.worklogs("PRJ-1", maxResults=100)) == 2
+        assert len(offline_jira.worklogs("PRJ-1", maxResults=100)) == 2
+    # once per client, pointing at the caller
+    assert len(record) == 1
+    assert record[0].filename == __file__
+
+
+def test_rate_limit_offline(offline_jira, monkeypatch):
+    now = [1000.0]
+    sleeps = []
+
+    def sleep(delay):
+        sleeps.append(delay)
+        now[0] += delay
+
+    monkeypatch.setattr(jira.resilientsession.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(jira.resilientsession.time, "sleep", sleep)
+    url = "http://localhost:2990/jira/rest/api/2/priority"
+    offline_jira.mocker.get(
+        url,
+        [
+            {"status_code": 429, "headers": {"Retry-After": "7"}, "json": {}},
+            {
+                "json": [],
+                "headers": {
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-FillRate": "10",
+                    "X-RateLimit-Interval-Seconds": "5",
+                },
+            },
+            {"json": [], "headers": {"X-RateLimit-Remaining": "9"}},
+            {"json": []},
+        ],
+    )
+
+    offline_jira.priorities()
+    assert sleeps == [7]
+    offline_jira.priorities()
+    assert sleeps == [7, 0.5]
+    offline_jira.priorities()
+    assert len(sleeps) == 2
+
+
+@pytest.mark.parametrize("async_", [False, True])
+def test_add_watchers_offline(offline_jira, async_):
+    offline_jira._options["async"] = async_
+    watchers = offline_jira.mocker.post(
+        "http://localhost:2990/jira/rest/api/2/issue/PRJ-1/watchers", status_code=204
+    )
+
+    offline_jira.add_watchers("PRJ-1", ["ann", "bob", "eve"])
+
+    assert sorted(r.json() for r in watchers.request_history) == ["ann", "bob", "eve"]
+
+
+def test_sub_resource_ttl_offline(offline_jira):
+    base = "http://localhost:2990/jira/rest/api/2/issue/PRJ-1/comment"
+    offline_jira.mocker.get(base, json={"comments": [{"id": "1", "body": "one"}]})
+    single = offline_jira.mocker.get(base + "/1", json={"id": "1", "body": "one"})
+    offline_jira.mocker.post(base, json={"id": "2", "body": "two"})
+
+    offline_jira.comments("PRJ-1")
+    offline_jira.comment("PRJ-1", "1")
+    assert single.call_count == 1
+
+    offline_jira._options["sub_resource_ttl"] = 60
+    offline_jira.comments("PRJ-1")
+    assert offline_jira.comment("PRJ-1", "1").body == "one"
+    assert single.call_count == 1
+
+    offline_jira.add_comment("PRJ-1", "two")
+    offline_jira.comment("PRJ-1", "1")
+    assert single.call_count == 2
+
+
+def test_add_remote_link_object_offline(offline_jira):
+    applinks = offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/applinks/latest/listApplicationlinks",
+        json={"list": []},
+    )
+    remotelink = offline_jira.mocker.post(
+        "http://localhost:2990/jira/rest/api/2/issue/PRJ-1/remotelink",
+        json={"id": 1},
+    )
+
+    offline_jira.add_remote_link(
+        "PRJ-1", {"url": "http://example.com", "title": "Example"}, globalId="g"
+    )
+
+    assert applinks.call_count == 0
+    assert remotelink.last_request.json()["globalId"] == "g"
+
+
+def test_etag_revalidation_offline(offline_jira):
+    def editmeta(request, context):
+        if request.headers.get("If-None-Match") == '"v1"':
+            context.status_code = 304
+            return None
+        context.headers["ETag"] = '"v1"'
+        return {"fields": {"summary": {"required": True}}}
+
+    meta = offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/api/2/issue/PRJ-1/editmeta", json=editmeta
+    )
+
+    first = offline_jira.editmeta("PRJ-1")
+    first["fields"].clear()
+    second = offline_jira.editmeta("PRJ-1")
+
+    assert meta.call_count == 2
+    assert meta.last_request.headers["If-None-Match"] == '"v1"'
+    assert second == {"fields": {"summary": {"required": True}}}
+
+
+def test_transition_name_casefold_offline(offline_jira):
+    offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/api/2/issue/PRJ-1/transitions",
+        json={"transitions": [{"id": "11", "name": "Schließen"}]},
+    )
+
+    assert offline_jira.find_transitionid_by_name("PRJ-1", "SCHLIESSEN") == "11"
+
+
+def test_search_issues_field_aliases_offline(offline_jira):
+    offline_jira._fields = {"Story Points": "customfield_1"}
+    page = _issues_page(0, 50, 2)
+    page["issues"][0]["fields"] = {"customfield_1": 3}
+    search = offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/api/2/search", json=page
+    )
+
+    issues = offline_jira.search_issues("project = PRJ", fields="Story Points,summary")
+
+    assert search.last_request.qs["fields"] == ["customfield_1", "summary"]
+    assert issues[0].raw["fields"]["Story Points"] == 3
+    assert issues[1].raw["fields"] == {}
+
+
+def test_get_project_version_by_name_offline(offline_jira):
+    base = "http://localhost:2990/jira/rest/api/2/project/"
+    paginated = offline_jira.mocker.get(
+        base + "PRJ/version",
+        json={
+            "startAt": 0,
+            "maxResults": 50,
+            "total": 2,
+            "isLast": True,
+            "values": [{"id": "1", "name": "1.0.1"}, {"id": "2", "name": "1.0"}],
+        },
+    )
+    offline_jira.mocker.get(base + "OLD/version", status_code=404)
+    offline_jira.mocker.get(
+        base + "OLD/versions",
+        json=[{"id": "3", "name": "2.0"}, {"id": "4", "name": "2.1"}],
+    )
+
+    assert offline_jira.get_project_version_by_name("PRJ", "1.0").id == "2"
+    assert paginated.last_request.qs["query"] == ["1.0"]
+    assert offline_jira.get_project_version_by_name("OLD", "2.0").id == "3"
+
+
+def test_get_url_offline(offline_jira):
+    assert (
+        offline_jira._get_url("issue/PRJ-1")
+        == "http://localhost:2990/jira/rest/api/2/issue/PRJ-1"
+    )
+    offline_jira._options["rest_api_version"] = "3"
+    assert (
+        offline_jira._get_url("myself")
+        == "http://localhost:2990/jira/rest/api/3/myself"
+    )
+    assert (
+        offline_jira._get_url("board", base=offline_jira.AGILE_BASE_URL)
+        == "http://localhost:2990/jira/rest/greenhopper/1.0/board"
+    )
+    offline_jira._options["agile_rest_path"] = "agile"
+    assert (
+        offline_jira._get_url("board", base=offline_jira.AGILE_BASE_URL)
+        == "http://localhost:2990/jira/rest/agile/1.0/board"
+    )
+    assert (
+        offline_jira._get_url("x", base="{server}/{path}/y")
+        == "http://localhost:2990/jira/x/y"
+    )
+
+
+@pytest.mark.parametrize("async_", [False, True])
+def test_create_temp_user_avatars_offline(offline_jira, async_, tmp_path):
+    offline_jira._options["async"] = async_
+    paths = []
+    for name in ("ann", "bob"):
+        path = tmp_path / ("%s.png" % name)
+        path.write_bytes(name.encode() * 3)
+        paths.append((name, str(path)))
+
+    def cropping(request, context):
+        return {"user": request.qs["username"][0], "size": request.qs["size"][0]}
+
+    uploads = offline_jira.mocker.post(
+        "http://localhost:2990/jira/rest/api/2/user/avatar/temporary", json=cropping
+    )
+
+    results = offline_jira.create_temp_user_avatars(paths, contentType="image/png")
+
+    assert results == [{"user": "ann", "size": "9"}, {"user": "bob", "size": "9"}]
+    assert sorted(r.body for r in uploads.request_history) == [
+        b"annannann",
+        b"bobbobbob",
+    ]
+    assert all(
+        r.headers["content-type"] == "image/png" for r in uploads.request_history
+    )
+
+
+def test_get_mime_type_cache_offline(offline_jira):
+    calls = []
+
+    class FakeMagic:
+        def id_buffer(self, buff):
+            calls.append(buff)
+            return "image/png"
+
+    offline_jira._magic = FakeMagic()
+
+    assert offline_jira._get_mime_type(b"one") == "image/png"
+    assert offline_jira._get_mime_type(b"one") == "image/png"
+    assert offline_jira._get_mime_type(b"two") == "image/png"
+    # keyed on the size and the first bytes only
+    assert offline_jira._get_mime_type(b"two" + b"\0" * 1024) == "image/png"
+    assert offline_jira._get_mime_type(b"two" + b"\0" * 1023 + b"1") == "image/png"
+    assert calls == [b"one", b"two", b"two" + b"\0" * 1024]
+
+
+def test_create_version_offline(offline_jira, monkeypatch):
+    monkeypatch.setattr(jira.client.time, "sleep", pytest.fail)
+    offline_jira.mocker.post(
+        "http://localhost:2990/jira/rest/api/2/version",
+        json={"id": "10", "name": "1.0", "self": "version/10"},
+    )
+
+    version = offline_jira.create_version("1.0", "PRJ")
+
+    assert version.id == "10"
+    assert offline_jira.mocker.last_request.json()["project"] == "PRJ"
+
+
+def test_server_info_retry_offline(offline_jira, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(jira.client.time, "sleep", sleeps.append)
+    offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/api/2/serverInfo",
+        [{"json": {}}, {"json": {}}, {"json": {"version": "8.5.0"}}],
+    )
+
+    assert offline_jira.server_info() == {"version": "8.5.0"}
+    assert sleeps == [0.05, 0.1]
+
+
+def test_project_roles_offline(offline_jira):
+    url = "http://localhost:2990/jira/rest/api/2/project/PRJ/role/10002"
+    offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/api/2/project/PRJ/role",
+        json={"Developers": url},
+    )
+
+    assert offline_jira.project_roles("PRJ") == {
+        "Developers": {"id": "10002", "url": url}
+    }
+
+
+def test_timestamp_offline(monkeypatch):
+    monkeypatch.setattr(jira.client.time, "time", lambda: 1600000000.75)
+
+    assert JIRA._timestamp() == 1600000000
+    assert JIRA._timestamp(datetime.timedelta(minutes=3)) == 1600000180
+
+
+@pytest.mark.parametrize(
+    "kwargs, body",
+    [
+        ({"position": "First"}, {"position": "First"}),
+        ({"position": "Somewhere"}, {"position": "Somewhere"}),
+        ({"after": "version/9"}, {"after": "version/9"}),
+        ({}, {}),
+    ],
+)
+def test_move_version_offline(offline_jira, kwargs, body):
+    offline_jira.mocker.post(
+        "http://localhost:2990/jira/rest/api/2/version/10/move",
+        json={"id": "10", "self": "version/10"},
+    )
+
+    assert offline_jira.move_version("10", **kwargs).id == "10"
+    assert offline_jira.mocker.last_request.json() == body
+
+
+def test_status_metadata_ttl_offline(offline_jira):
+    base = "http://localhost:2990/jira/rest/api/2/"
+    statuses = offline_jira.mocker.get(
+        base + "status", json=[{"id": "1", "name": "Open"}, {"id": "3", "name": "Done"}]
+    )
+    single = offline_jira.mocker.get(base + "status/5", json={"id": "5", "name": "New"})
+
+    offline_jira._options["metadata_ttl"] = 300
+    assert offline_jira.status("3").name == "Done"
+    assert offline_jira.status("1").name == "Open"
+    assert [s.name for s in offline_jira.statuses()] == ["Open", "Done"]
+    assert statuses.call_count == 1
+
+    # unknown ids are still requested
+    assert offline_jira.status("5").name == "New"
+    assert single.call_count == 1
+
+
+def test_iter_search_issues_offline(offline_jira):
+    offline_jira._fields = {"Story Points": "customfield_1"}
+
+    def search(request, context):
+        page = _issues_page(int(request.qs.get("startat", [0])[0]), 2, 5)
+        for issue in page["issues"]:
+            issue["fields"] = {"customfield_1": issue["key"]}
+        return page
+
+    pages = offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/api/2/search", json=search
+    )
+
+    issues = offline_jira.iter_search_issues("project = PRJ", fields="Story Points")
+
+    assert pages.call_count == 0
+    first = next(issues)
+    assert first.raw["fields"]["Story Points"] == "PRJ-0"
+    keys = [first.key] + [issue.key for issue in issues]
+    assert keys == ["PRJ-%s" % i for i in range(5)]
+    assert pages.call_count == 3
+
+
+def test_deactivate_user_cloud_offline(offline_jira):
+    offline_jira.deploymentType = "Cloud"
+    offline_jira.authCookie = "JSESSIONID=abc"
+    deactivate = offline_jira.mocker.post(
+        "http://localhost:2990/jira/admin/rest/um/1/user/deactivate", status_code=200
+    )
+
+    assert offline_jira.deactivate_user("ann") is True
+    session = offline_jira._deactivate_session
+    assert offline_jira.deactivate_user("bob+jira@example.com") is True
+
+    assert offline_jira._deactivate_session is session
+    assert [r.qs["username"] for r in deactivate.request_history] == [
+        ["ann"],
+        ["bob+jira@example.com"],
+    ]
+    assert deactivate.last_request.headers["Cookie"] == "JSESSIONID=abc"
+
+
+@pytest.mark.parametrize("async_", [False, True])
+def test_create_project_lookups_offline(offline_jira, async_):
+    offline_jira._options["async"] = async_
+    base = "http://localhost:2990/jira/rest/api/"
+    lookups = [
+        offline_jira.mocker.get(base + "2/myself", json={"accountId": "acc-1"}),
+        offline_jira.mocker.get(
+            base + "3/permissionscheme",
+            json={
+                "permissionSchemes": [{"id": 1, "name": "Default Permission Scheme"}]
+            },
+        ),
+        offline_jira.mocker.get(
+            base + "3/issuesecurityschemes",
+            json={"issueSecuritySchemes": [{"id": 2, "name": "Default"}]},
+        ),
+        offline_jira.mocker.get(
+            base + "3/projectCategory", json=[{"id": 3, "name": "Default"}]
+        ),
+    ]
+    create = offline_jira.mocker.post(base + "3/project", json={"id": 10})
+
+    assert offline_jira.create_project("PRJ") == {"id": 10}
+
+    assert [lookup.call_count for lookup in lookups] == [1, 1, 1, 1]
+    payload = create.last_request.json()
+    assert payload["leadAccountId"] == "acc-1"
+    assert (
+        payload["permissionScheme"],
+        payload["issueSecurityScheme"],
+        payload["categoryId"],
+    ) == (1, 2, 3)
+
+
+def test_backup_download_offline(offline_jira, tmp_path):
+    offline_jira.deploymentType = "Cloud"
+    offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/obm/1.0/getprogress",
+        json={"fileName": "backup.zip"},
+    )
+    content = b"x" * (3 * 1024 * 1024 + 5)
+    offline_jira.mocker.get(
+        "http://localhost:2990/jira/webdav/backupmanager/backup.zip", content=content
+    )
+    local_file = tmp_path / "backup.zip"
+
+    offline_jira.backup_download(str(local_file))
+
+    assert local_file.read_bytes() == content
+
+
+@pytest.mark.parametrize(
+    "percentage, size, complete",
+    [("Estimated progress: 42 %", "0", False), ("Estimated: 100 %", "10", True)],
+)
+def test_backup_complete_offline(offline_jira, percentage, size, complete):
+    offline_jira.deploymentType = "Cloud"
+    offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/obm/1.0/getprogress",
+        json={"alternativePercentage": percentage, "size": size},
+    )
+
+    assert offline_jira.backup_complete() is complete
+
+
+def test_current_user_offline(offline_jira):
+    myself = offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/api/2/myself",
+        json={"key": "ann", "accountId": "acc-1"},
+    )
+
+    assert offline_jira.current_user() == "ann"
+    assert offline_jira.current_user("accountId") == "acc-1"
+    assert myself.call_count == 1
+
+
+@pytest.mark.parametrize("attachments", [False, True])
+def test_backup_cloud_offline(offline_jira, attachments):
+    offline_jira.deploymentType = "Cloud"
+    run = offline_jira.mocker.post(
+        "http://localhost:2990/jira/rest/backup/1/export/runbackup", status_code=200
+    )
+
+    assert offline_jira.backup(attachments=attachments) is True
+    assert run.last_request.json() == {"cbAttachments": attachments}
+
+
+@pytest.mark.parametrize(
+    "page, force, reindexed",
+    [
+        ("<p>Up to date</p>", False, False),
+        ("<p>To perform the re-index now, please go to the page</p>", False, True),
+        ("<p>Up to date</p>", True, True),
+        ("<p>All issues are being re-indexed</p>", True, False),
+    ],
+)
+def test_reindex_offline(offline_jira, page, force, reindexed):
+    url = "http://localhost:2990/jira/secure/admin/jira/IndexReIndex.jspa"
+    offline_jira.mocker.get(url, text=page)
+    post = offline_jira.mocker.post(url, text="All issues are being re-indexed")
+
+    assert offline_jira.reindex(force=force) is True
+    assert post.called is reindexed
+
+
+def test_backup_progress_xml_offline(offline_jira):
+    offline_jira.deploymentType = "Cloud"
+    offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/obm/1.0/getprogress",
+        content=b'<?xml version="1.0"?><status fileName="b.zip" size="10"/>',
+    )
+
+    assert offline_jira.backup_progress() == {"fileName": "b.zip", "size": "10"}
+
+
+def test_screens_refetched_after_delete_offline(offline_jira):
+    url = "http://localhost:2990/jira/rest/api/3/screens"
+    screens = offline_jira.mocker.get(
+        url,
+        [
+            {"json": {"values": [{"id": 1}, {"id": 3}]}},
+            {"json": {"values": [{"id": 1}]}},
+        ],
+    )
+    offline_jira.mocker.delete(url + "/3", status_code=204)
+
+    assert offline_jira.screens() == [{"id": 1}, {"id": 3}]
+    assert offline_jira.screens() == [{"id": 1}, {"id": 3}]
+    assert offline_jira.delete_screen(3) is True
+    assert offline_jira.screens() == [{"id": 1}]
+
+    assert screens.call_count == 2
+
+
+def test_find_default_offline():
+    items = [{"id": 1, "name": "Other"}, {"id": 2, "name": "Default"}]
+
+    assert JIRA._find_default(items) == 2
+    assert JIRA._find_default(items, "Missing") == 1
+    assert JIRA._find_default([]) is None
+
+
+@pytest.mark.parametrize(
+    "buff, mime_type, libmagic",
+    [
+        (b"\x89PNG\r\n\x1a\n\x00\x00", "image/png", False),
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF", "image/jpeg", False),
+        (b"RIFF\x00\x00\x00\x00WEBPVP8 ", "image/webp", False),
+        (b"RIFF\x00\x00\x00\x00WAVEfmt ", "audio/x-wav", True),
+    ],
+)
+def test_get_mime_type_prefixes_offline(offline_jira, buff, mime_type, libmagic):
+    calls = []
+
+    class FakeMagic:
+        def id_buffer(self, buff):
+            calls.append(buff)
+            return "audio/x-wav"
+
+    offline_jira._magic = FakeMagic()
+
+    assert offline_jira._get_mime_type(buff) == mime_type
+    assert bool(calls) is libmagic
+    assert bool(offline_jira._mime_types) is libmagic
+
+
+def test_sprint_field_id_offline(offline_jira):
+    fields = offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/api/2/field",
+        json=[{"name": "Sprint", "schema": {"customId": 10100}}],
+    )
+
+    assert offline_jira._get_sprint_field_id() == 10100
+    assert offline_jira._get_sprint_field_id() == 10100
+    assert fields.call_count == 1
+
+
+def test_rank_field_lookup_offline(offline_jira):
+    offline_jira._options["agile_rest_path"] = "agile"
+    fields = offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/api/2/field", json=[]
+    )
+    rank = offline_jira.mocker.put(
+        "http://localhost:2990/jira/rest/agile/1.0/issue/rank", status_code=204
+    )
+
+    offline_jira.rank("PRJ-1", "PRJ-2")
+    offline_jira.rank("PRJ-3", "PRJ-4")
+
+    assert fields.call_count == 1
+    assert rank.last_request.json()["rankCustomFieldId"] is None
+
+
+def test_rank_field_lookup_failed_offline(offline_jira):
+    offline_jira._options["agile_rest_path"] = "agile"
+    rank_field = {
+        "name": "Rank",
+        "schema": {"custom": "com.pyxis.greenhopper.jira:gh-lexo-rank", "customId": 7},
+    }
+    offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/api/2/field",
+        [{"status_code": 401}, {"json": [rank_field]}],
+    )
+    rank = offline_jira.mocker.put(
+        "http://localhost:2990/jira/rest/agile/1.0/issue/rank", status_code=204
+    )
+
+    with pytest.raises(JIRAError):
+        offline_jira.rank("PRJ-1", "PRJ-2")
+    offline_jira.rank("PRJ-1", "PRJ-2")
+
+    assert rank.call_count == 1
+    assert rank.last_request.json()["rankCustomFieldId"] == 7
+
+
+def test_sprint_report_ttl_offline(offline_jira):
+    report = offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/greenhopper/1.0/rapid/charts/sprintreport",
+        json={
+            "contents": {
+                "incompletedIssuesEstimateSum": {"value": 5},
+                "puntedIssuesEstimateSum": {"value": 2},
+                "puntedIssues": [{"key": "PRJ-1"}],
+            }
+        },
+    )
+
+    assert offline_jira.removedIssuesEstimateSum(1, 2) == 2
+    assert offline_jira.removedIssuesEstimateSum(1, 2) == 2
+    assert report.call_count == 2
+
+    offline_jira._options["sprint_report_ttl"] = 60
+    assert offline_jira.incompletedIssuesEstimateSum(1, 2) == 5
+    assert [i.key for i in offline_jira.removed_issues(1, 2)] == ["PRJ-1"]
+    assert offline_jira.removedIssuesEstimateSum(1, 2) == 2
+    assert report.call_count == 3
+    assert report.last_request.qs == {"rapidviewid": ["1"], "sprintid": ["2"]}
+
+
+@pytest.mark.parametrize("async_", [False, True])
+def test_sprints_extended_offline(offline_jira, async_):
+    offline_jira._options["async"] = async_
+    base = "http://localhost:2990/jira/rest/greenhopper/1.0/"
+    offline_jira.mocker.get(
+        base + "sprintquery/7",
+        json={"sprints": [{"id": i, "name": "S%s" % i} for i in range(4)]},
+    )
+    for i in range(4):
+        offline_jira.mocker.get(
+            base + "sprint/%s/edit/model" % i,
+            json={"sprint": {"id": i, "name": "S%s" % i, "startDate": "d%s" % i}},
+        )
+
+    sprints = offline_jira.sprints(7, extended=True)
+
+    assert [s.startDate for s in sprints] == ["d0", "d1", "d2", "d3"]
+
+
+def test_sprints_extended_aiohttp_offline(offline_jira, monkeypatch):
+    offline_jira._options.update({"async": True, "async_backend": "aiohttp"})
+    base = "http://localhost:2990/jira/rest/greenhopper/1.0/"
+    offline_jira.mocker.get(
+        base + "sprintquery/7", json={"sprints": [{"id": 1}, {"id": 2}]}
+    )
+    sent = []
+
+    def get_many(requests_):
+        sent.extend(requests_)
+        return [{"sprint": {"id": i, "startDate": "d%s" % i}} for i in (1, 2)]
+
+    monkeypatch.setattr(offline_jira, "_get_many_aiohttp", get_many)
+
+    sprints = offline_jira.sprints(7, extended=True)
+
+    assert [s.startDate for s in sprints] == ["d1", "d2"]
+    assert sent == [
+        (base + "sprint/1/edit/model", ()),
+        (base + "sprint/2/edit/model", ()),
+    ]
+
+
+@pytest.mark.parametrize("async_", [False, True])
+def test_add_issues_to_sprint_chunks_offline(offline_jira, async_):
+    offline_jira._options.update(
+        {"async": async_, "agile_rest_path": "agile", "agile_rest_api_version": "1.0"}
+    )
+    url = "http://localhost:2990/jira/rest/agile/1.0/sprint/3/issue"
+    adding = offline_jira.mocker.post(url, status_code=204)
+    keys = ["PRJ-%s" % i for i in range(120)]
+
+    offline_jira.add_issues_to_sprint(3, keys)
+
+    assert adding.call_count == 3
+    sent = sorted((r.json()["issues"] for r in adding.request_history), key=len)
+    assert [len(chunk) for chunk in sent] == [20, 50, 50]
+    assert sorted(key for chunk in sent for key in chunk) == sorted(keys)
+
+    offline_jira.add_issues_to_sprint(3, keys, chunk_size=None)
+    assert adding.call_count == 4
+    assert adding.last_request.json() == {"issues": keys}
+
+
+def test_add_issues_to_epic_chunks_offline(offline_jira):
+    url = "http://localhost:2990/jira/rest/greenhopper/1.0/epics/5/add"
+    adding = offline_jira.mocker.put(url, json={})
+
+    offline_jira.add_issues_to_epic(5, ["PRJ-1", "PRJ-2", "PRJ-3"], chunk_size=2)
+
+    assert [r.json() for r in adding.request_history] == [
+        {"issueKeys": ["PRJ-1", "PRJ-2"], "ignoreEpics": True},
+        {"issueKeys": ["PRJ-3"], "ignoreEpics": True},
+    ]
+
+    offline_jira.add_issues_to_epic(5, "PRJ-4")
+    assert adding.last_request.json() == {"issueKeys": "PRJ-4", "ignoreEpics": True}
+
+
+def test_create_board_project_ids_offline(offline_jira):
+    api = "http://localhost:2990/jira/rest/api/2/"
+    listing = offline_jira.mocker.get(
+        api + "project", json=[{"id": "10", "key": "A"}, {"id": "11", "key": "B"}]
+    )
+    single = offline_jira.mocker.get(api + "project/C", json={"id": "12", "key": "C"})
+    create = offline_jira.mocker.post(
+        "http://localhost:2990/jira/rest/greenhopper/1.0/rapidview/create/presets",
+        json={"id": 1, "name": "board"},
+    )
+
+    board = offline_jira.create_board("board", "A,B,C", location_id="B")
+
+    assert board.id == 1
+    assert create.last_request.json()["projectIds"] == ["10", "11", "12"]
+    assert listing.call_count == 1
+    assert single.call_count == 1
+
+    offline_jira.create_board("board", "C,A")
+    assert create.last_request.json()["projectIds"] == ["12", "10"]
+    assert listing.call_count == 1
+    assert single.call_count == 1
+
+
+def test_create_sprint_greenhopper_oneshot_offline(offline_jira):
+    base = "http://localhost:2990/jira/rest/greenhopper/1.0/"
+    create = offline_jira.mocker.post(
+        base + "sprint/7", json={"id": 1, "name": "Sprint 1"}
+    )
+    update = offline_jira.mocker.put(base + "sprint/1", json={"id": 1, "name": "S"})
+
+    assert offline_jira.create_sprint("S", 7).name == "S"
+    assert create.last_request.json() == {"name": "S"}
+    assert update.call_count == 1
+
+    # the fields were not taken, they are no longer sent with the creation
+    assert offline_jira.create_sprint("S", 7).name == "S"
+    assert create.call_count == 2
+    assert create.last_request.body is None
+    assert update.call_count == 2
+
+    offline_jira._greenhopper_create_sprint_oneshot = None
+    create = offline_jira.mocker.post(base + "sprint/7", json={"id": 2, "name": "T"})
+    assert offline_jira.create_sprint("T", 7).id == 2
+    assert offline_jira.create_sprint("T", 7).id == 2
+    assert create.call_count == 2
+    assert update.call_count == 2
+    assert offline_jira._greenhopper_create_sprint_oneshot is True
+
+    # the name was taken but not the dates
+    update = offline_jira.mocker.put(
+        base + "sprint/2", json={"id": 2, "name": "T", "startDate": "2020-01-01"}
+    )
+    sprint = offline_jira.create_sprint("T", 7, startDate="2020-01-01")
+    assert sprint.startDate == "2020-01-01"
+    assert update.last_request.json() == {"name": "T", "startDate": "2020-01-01"}
+    assert offline_jira._greenhopper_create_sprint_oneshot is False
+
+
+def test_sprint_report_offline(offline_jira):
+    report = offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/greenhopper/1.0/rapid/charts/sprintreport",
+        json={
+            "contents": {
+                "incompletedIssuesEstimateSum": {"value": 5},
+                "puntedIssuesEstimateSum": {"value": 2},
+                "puntedIssues": [{"key": "PRJ-1"}],
+            },
+            "sprint": {"id": 2, "name": "S"},
+        },
+    )
+
+    sprint_report = offline_jira.sprint_report(1, 2)
+
+    assert sprint_report.incompleted_issues_estimate_sum == 5
+    assert sprint_report.removed_issues_estimate_sum == 2
+    assert [i.key for i in sprint_report.removed_issues] == ["PRJ-1"]
+    assert sprint_report.sprint.name == "S"
+    assert report.call_count == 1
+
+
+def test_move_to_backlog_warns_once_offline(offline_jira):
+    offline_jira._options["agile_rest_path"] = "agile"
+    offline_jira.mocker.post(
+        "http://localhost:2990/jira/rest/agile/1.0/backlog/issue", status_code=404
+    )
+
+    with pytest.warns(UserWarning) as record:
+        for _ in range(2):
+            with pytest.raises(JIRAError):
+                offline_jira.move_to_backlog(["PRJ-%s" % i for i in range(60)])
+
+    assert len(record) == 1
+
+
+def test_sprints_by_name_offline(offline_jira):
+    offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/greenhopper/1.0/sprintquery/7",
+        json={"sprints": [{"id": 1, "name": "S1"}, {"id": 2, "name": "S2"}]},
+    )
+
+    assert list(offline_jira.sprints_by_name(7)) == ["S1", "S2"]
+    assert next(offline_jira.iter_sprints_by_name(7)) == (
+        "S1",
+        {"id": 1, "name": "S1"},
+    )
+
+    offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/greenhopper/1.0/sprintquery/7",
+        json={"sprints": [{"id": 1, "name": "S"}, {"id": 2, "name": "S"}]},
+    )
+    with pytest.raises(ValueError, match="Duplicate sprint name: S"):
+        offline_jira.sprints_by_name(7)
+
+
+def test_sprints_revalidated_offline(offline_jira):
+    sprintquery = offline_jira.mocker.get(
+        "http://localhost:2990/jira/rest/greenhopper/1.0/sprintquery/7",
+        [
+            {"json": {"sprints": [{"id": 1, "name": "S1"}]}, "headers": {"ETag": "v"}},
+            {"status_code": 304},
+        ],
+    )
+
+    assert [s.name for s in offline_jira.sprints(7)] == ["S1"]
+    assert [s.name for s in offline_jira.sprints(7)] == ["S1"]
+
+    assert sprintquery.call_count == 2
+    assert sprintquery.last_request.headers["If-None-Match"] == "v"
+    assert sprintquery.last_request.qs == {
+        "includehistoricsprints": ["true"],
+        "includefuturesprints": ["true"],
+    }
+
+
+def test_update_sprint_offline(offline_jira):
+    update = offline_jira.mocker.put(
+        "http://localhost:2990/jira/rest/greenhopper/1.0/sprint/3",
+        json={"id": 3, "name": "S"},
+    )
+
+    assert offline_jira.update_sprint(3) is None
+    assert update.call_count == 0
+
+    assert offline_jira.update_sprint(3, name="S") == {"id": 3, "name": "S"}
+    assert update.last_request.json() == {"name": "S"}